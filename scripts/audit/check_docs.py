@@ -18,6 +18,9 @@ import os
 import re
 import sys
 
+# Match public class or function definition ONLY at column 0
+DEFINITION_PATTERN = re.compile(r"^(class|async def|def) ([a-zA-Z_][a-zA-Z0-9_]*)(?:\(.*\))?:")
+
 
 def check_file(filepath):
     r"""
@@ -26,6 +29,7 @@ def check_file(filepath):
     Checks for:
     1. Apache 2.0 license header.
     2. r\"\"\" docstrings for top-level public classes and functions.
+    3. Top-level classes defined more than once (e.g. merge-conflict leftovers).
 
     Args:
         filepath (`str`): Path to the python file to audit.
@@ -44,11 +48,19 @@ def check_file(filepath):
 
     # 2. Docstring check for top-level public classes and functions
     lines = content.splitlines()
+    class_lines = {}
     for i, line in enumerate(lines):
-        # Match public class or function definition ONLY at column 0
-        match = re.match(r"^(class|async def|def) ([a-zA-Z_][a-zA-Z0-9_]*)(?:\(.*\))?:", line)
+        match = DEFINITION_PATTERN.match(line)
         if match:
             kind, name = match.groups()
+
+            # 3. A redefined class silently shadows the earlier one and rebuilds its schema
+            if kind == "class":
+                if name in class_lines:
+                    errors.append(f"Duplicate class definition: {name} (lines {class_lines[name]} and {i + 1})")
+                else:
+                    class_lines[name] = i + 1
+
             if name.startswith("_") or name.startswith("test_") or name == "main":
                 continue
 
@@ -22,14 +22,25 @@ compatibility.
 """
 
 from importlib import import_module
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from xrtm.forecast.core.orchestrator import Orchestrator
-from xrtm.forecast.core.runtime import AsyncRuntime
-from xrtm.forecast.core.schemas.graph import BaseGraphState, TemporalContext
-from xrtm.forecast.kit.assistants.main import create_forecasting_analyst
 from xrtm.forecast.version import __author__, __contact__, __copyright__, __license__, __version__
 
+if TYPE_CHECKING:
+    from xrtm.forecast.core.orchestrator import Orchestrator
+    from xrtm.forecast.core.runtime import AsyncRuntime
+    from xrtm.forecast.core.schemas.graph import BaseGraphState, TemporalContext
+    from xrtm.forecast.kit.assistants.main import create_forecasting_analyst
+
+# Curated exports are resolved on first access so ``import xrtm.forecast`` stays cheap.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "Orchestrator": ("xrtm.forecast.core.orchestrator", "Orchestrator"),
+    "AsyncRuntime": ("xrtm.forecast.core.runtime", "AsyncRuntime"),
+    "BaseGraphState": ("xrtm.forecast.core.schemas.graph", "BaseGraphState"),
+    "TemporalContext": ("xrtm.forecast.core.schemas.graph", "TemporalContext"),
+    "create_forecasting_analyst": ("xrtm.forecast.kit.assistants.main", "create_forecasting_analyst"),
+}
+
 _LEGACY_EXPORTS: dict[str, tuple[str, str]] = {
     "Agent": ("xrtm.forecast.kit.agents.base", "Agent"),
     "ForecastingAnalyst": ("xrtm.forecast.kit.agents.specialists.analyst", "ForecastingAnalyst"),
@@ -57,12 +68,15 @@ __all__ = [
 
 
 def __getattr__(name: str) -> Any:
-    if name not in _LEGACY_EXPORTS:
+    target = _LAZY_EXPORTS.get(name) or _LEGACY_EXPORTS.get(name)
+    if target is None:
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    module_name, attr_name = _LEGACY_EXPORTS[name]
-    return getattr(import_module(module_name), attr_name)
+    module_name, attr_name = target
+    value = getattr(import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
 
 
 def __dir__() -> list[str]:
-    return sorted(set(globals()) | set(_LEGACY_EXPORTS))
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(_LEGACY_EXPORTS))
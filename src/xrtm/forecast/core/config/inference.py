@@ -20,7 +20,7 @@ including API keys, model identifiers, generation parameters.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Self
 
 from pydantic import BaseModel, Field, SecretStr
 
@@ -46,6 +46,27 @@ class ProviderConfig(BaseModel):
     timeout: int = 30
     extra: Dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> Self:
+        r"""
+        Builds a config from already-validated values, skipping Pydantic validation.
+
+        Intended for internal or test paths where the inputs are known to be well-formed.
+        Unset fields receive their declared defaults.
+
+        Args:
+            **values: Field values for the config.
+
+        Returns:
+            `ProviderConfig`: The constructed config instance.
+
+        Example:
+            ```python
+            >>> config = OpenAIConfig.from_trusted(model_id="gpt-4o-mini", api_key=SecretStr("sk-..."))
+            ```
+        r"""
+        return cls.model_construct(**values)
+
 
 class OpenAIConfig(ProviderConfig):
     r"""Specific configuration for OpenAI or compatible backends."""
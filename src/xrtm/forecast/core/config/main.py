@@ -16,11 +16,14 @@
 r"""Unified platform configuration.
 
 Central ``Settings`` class that loads values from environment
-variables with the ``FORECAST_`` prefix.
+variables with the ``FORECAST_`` prefix. The shared instance is built on
+first access through ``get_settings`` so importing this module never
+reads ``.env``.
 """
 
+import functools
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -49,7 +52,33 @@ class Settings(BaseSettings):
     default_timeout: int = 30
 
 
-# Singleton instance for library-wide usage
-settings = Settings()
+@functools.lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    r"""
+    Returns the library-wide `Settings` instance, building it on first call.
+
+    Returns:
+        `Settings`: The shared settings object.
+
+    Example:
+        ```python
+        >>> from xrtm.forecast.core.config.main import get_settings
+        >>> get_settings().default_timeout
+        30
+        ```
+    r"""
+    return Settings()
+
+
+if TYPE_CHECKING:
+    settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from ...main import settings` working without paying for it at import.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["Settings", "settings"]
+__all__ = ["Settings", "get_settings", "settings"]
@@ -17,11 +17,42 @@ r"""
 Core interfaces for Sovereign Knowledge Graphs (Institutional Memory).
 r"""
 
+import functools
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+# Default for `match(object_value=...)`: a wildcard distinct from `None`, which is a valid fact value.
+_ANY: Any = object()
+
+
+@functools.lru_cache(maxsize=4096)
+def _shared_source_hash(value: str) -> str:
+    r"""
+    Returns the first-seen string equal to `value` from a bounded table.
+
+    Evidence digests are unbounded and high-cardinality, so they are not `sys.intern`ed
+    (interned strings are never freed on some Python versions); recently seen digests are
+    shared instead.
+    r"""
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _shared_subject(value: str) -> str:
+    r"""
+    Returns the first-seen string equal to `value` from a bounded table.
+
+    Subjects are open-ended entity names, so they are shared through a bounded table
+    rather than `sys.intern`ed; facts about recently seen subjects reuse one string.
+    r"""
+    return value
 
 
 class Fact(BaseModel):
@@ -40,12 +71,89 @@ class Fact(BaseModel):
     expires_at: Optional[datetime] = Field(default=None, description="When the fact should be considered stale.")
     confidence: float = Field(default=1.0, ge=0.0, le=1.0, description="Confidence in the fact truthfulness.")
 
+    @field_validator("subject")
+    @classmethod
+    def _share_subject(cls, value: str) -> str:
+        r"""Shares subject strings so facts about one entity reuse a single string."""
+        return _shared_subject(value)
+
+    @field_validator("predicate")
+    @classmethod
+    def _intern_predicate(cls, value: str) -> str:
+        r"""Interns predicates: facts reuse a small relationship vocabulary, so stores share one string per key."""
+        return sys.intern(value)
+
+    @field_validator("source_hash")
+    @classmethod
+    def _share_source_hash(cls, value: Optional[str]) -> Optional[str]:
+        r"""Shares evidence hashes so facts extracted from one document reuse a single string."""
+        return _shared_source_hash(value) if value is not None else None
+
     @property
     def is_stale(self) -> bool:
         r"""Checks if the fact has expired."""
-        if self.expires_at is None:
-            return False
-        return datetime.now(timezone.utc) > self.expires_at
+        return self.is_stale_at(datetime.now(timezone.utc))
+
+    def is_stale_at(self, now: datetime) -> bool:
+        r"""
+        Checks if the fact had expired at `now`.
+
+        Args:
+            now (`datetime`): The (timezone-aware) point in time to check against.
+
+        Returns:
+            `bool`: `True` if the fact has an expiry and `now` is past it.
+        r"""
+        expires_at = self.expires_at
+        return expires_at is not None and now > expires_at
+
+
+def filter_fresh(facts: Iterable[Fact], now: Optional[datetime] = None) -> List[Fact]:
+    r"""
+    Returns the facts that have not expired, reading the clock once for the whole batch.
+
+    Args:
+        facts (`Iterable[Fact]`): The facts to filter.
+        now (`datetime`, *optional*):
+            The (timezone-aware) reference time. Defaults to the current UTC time.
+
+    Returns:
+        `List[Fact]`: The non-stale facts, in input order.
+
+    Example:
+        ```python
+        >>> fresh = filter_fresh(await store.query("Tesla"))
+        ```
+    r"""
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return [fact for fact in facts if fact.expires_at is None or now <= fact.expires_at]
+
+
+_FACT_LIST_ADAPTER = TypeAdapter(List[Fact])
+
+
+def parse_facts(payloads: Iterable[Any]) -> List[Fact]:
+    r"""
+    Validates a batch of raw fact payloads in a single pass.
+
+    Bulk imports should prefer this over calling `Fact(**payload)` in a loop: the whole
+    list is handed to pydantic-core at once instead of re-entering the validator per fact.
+
+    Args:
+        payloads (`Iterable[Any]`): Dicts (or `Fact` instances) describing facts.
+
+    Returns:
+        `List[Fact]`: The validated facts, in input order.
+
+    Example:
+        ```python
+        >>> facts = parse_facts([{"subject": "Tesla", "predicate": "ceo", "object_value": "Elon Musk"}])
+        >>> facts[0].predicate
+        'ceo'
+        ```
+    r"""
+    return _FACT_LIST_ADAPTER.validate_python(list(payloads))
 
 
 class FactStore(ABC):
@@ -84,5 +192,420 @@ class FactStore(ABC):
         r"""
         pass
 
+    async def remember_many(self, facts: Iterable[Fact]) -> None:
+        r"""
+        Stores a batch of facts.
+
+        The default implementation calls `remember` once per fact. Stores with
+        transactional or indexed backends should override it to write the batch in one go.
+
+        Args:
+            facts (`Iterable[Fact]`): The facts to store, in order.
+        r"""
+        for fact in facts:
+            await self.remember(fact)
+
+    async def match(
+        self,
+        subject: Optional[str] = None,
+        predicate: Optional[str] = None,
+        object_value: Any = _ANY,
+    ) -> List[Fact]:
+        r"""
+        Returns facts matching a triple pattern; `None` subjects and predicates and an omitted
+        `object_value` act as wildcards.
+
+        The default implementation only supports patterns with a bound subject, which it
+        answers through `query`. Stores that keep predicate or object indexes (see
+        `InMemoryFactStore`) should override this to serve every pattern from an index.
+
+        Args:
+            subject (`str`, *optional*): The entity to match.
+            predicate (`str`, *optional*): The relationship to match.
+            object_value (`Any`, *optional*):
+                The value to match (compared with `==`); `None` matches facts whose value is `None`.
+                Omit it to match any value.
+
+        Returns:
+            `List[Fact]`: The matching facts.
+
+        Raises:
+            `NotImplementedError`: If `subject` is `None` and the store has no override.
+        r"""
+        if subject is None:
+            raise NotImplementedError(f"{type(self).__name__} can only match patterns with a bound subject.")
+        facts = await self.query(subject, predicate)
+        if object_value is _ANY:
+            return facts
+        return [fact for fact in facts if fact.object_value == object_value]
+
+    async def get_single(self, subject: str, predicate: str) -> Optional[Fact]:
+        r"""
+        Point lookup for a `(subject, predicate)` pair expected to hold at most one fact.
+
+        If several facts share the pair, the one remembered last wins, regardless of
+        `verified_at`. The default implementation returns the last result of `query`, so
+        it relies on `query` listing facts in the order they were remembered; indexed
+        stores override it to read the bucket directly.
+
+        Args:
+            subject (`str`): The entity to look up.
+            predicate (`str`): The relationship to look up.
+
+        Returns:
+            `Optional[Fact]`: The matching fact, or `None` if there is none.
+        r"""
+        facts = await self.query(subject, predicate)
+        return facts[-1] if facts else None
+
+
+class InMemoryFactStore(FactStore):
+    r"""
+    A process-local `FactStore` with subject, predicate and object indexes.
+
+    Facts are bucketed by `(subject, predicate)`. The subject-first (SPO) and
+    predicate-first (POS) indexes share the same bucket lists, and hashable object
+    values get an object-first (OSP) index, so any `match` pattern resolves to the
+    relevant bucket(s) instead of a scan over the whole store.
+
+    Example:
+        ```python
+        >>> store = InMemoryFactStore()
+        >>> await store.remember(Fact(subject="Tesla", predicate="ceo", object_value="Elon Musk"))
+        >>> await store.query_by_predicate("ceo")
+        [Fact(subject='Tesla', predicate='ceo', ...)]
+        ```
+    r"""
+
+    def __init__(self) -> None:
+        self._spo: Dict[str, Dict[str, List[Fact]]] = {}
+        self._pos: Dict[str, Dict[str, List[Fact]]] = {}
+        self._osp: Dict[Any, List[Fact]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for by_predicate in self._spo.values() for bucket in by_predicate.values())
+
+    async def remember(self, fact: Fact) -> None:
+        r"""
+        Stores a fact and indexes it by subject, predicate and (hashable) value.
+
+        Args:
+            fact (`Fact`): The fact object to store.
+        r"""
+        self._index(fact)
+
+    async def remember_many(self, facts: Iterable[Fact]) -> None:
+        r"""
+        Stores a batch of facts in one synchronous pass, without a coroutine hop per fact.
+
+        Args:
+            facts (`Iterable[Fact]`): The facts to store, in order.
+        r"""
+        index = self._index
+        for fact in facts:
+            index(fact)
+
+    def _index(self, fact: Fact) -> None:
+        by_predicate = self._spo.setdefault(fact.subject, {})
+        bucket = by_predicate.get(fact.predicate)
+        if bucket is None:
+            bucket = by_predicate[fact.predicate] = []
+            self._pos.setdefault(fact.predicate, {})[fact.subject] = bucket
+        bucket.append(fact)
+        try:
+            self._osp.setdefault(fact.object_value, []).append(fact)
+        except TypeError:
+            pass  # unhashable values are only reachable through a scan
+
+    async def query(self, subject: str, predicate: Optional[str] = None) -> List[Fact]:
+        r"""
+        Queries facts about a subject.
+
+        Args:
+            subject (`str`): The entity to query.
+            predicate (`str`, *optional*): The specific relationship to filter by.
+
+        Returns:
+            `List[Fact]`: A list of matching facts, in insertion order per predicate.
+        r"""
+        return await self.match(subject, predicate)
+
+    async def get_single(self, subject: str, predicate: str) -> Optional[Fact]:
+        r"""
+        Returns the last remembered fact for `(subject, predicate)` without copying its bucket.
+
+        Ties are broken by remember order, not by `verified_at`.
+
+        Args:
+            subject (`str`): The entity to look up.
+            predicate (`str`): The relationship to look up.
+
+        Returns:
+            `Optional[Fact]`: The matching fact, or `None` if there is none.
+        r"""
+        by_predicate = self._spo.get(subject)
+        if not by_predicate:
+            return None
+        bucket = by_predicate.get(predicate)
+        return bucket[-1] if bucket else None
+
+    async def forget(self, subject: str, predicate: Optional[str] = None) -> None:
+        r"""
+        Removes a subject's facts, or only those with the given predicate.
+
+        Args:
+            subject (`str`): The entity whose facts are removed.
+            predicate (`str`, *optional*): Restricts removal to this relationship.
+        r"""
+        by_predicate = self._spo.get(subject)
+        if not by_predicate:
+            return
+        predicates = [predicate] if predicate is not None else list(by_predicate)
+        removed: List[Fact] = []
+        for name in predicates:
+            bucket = by_predicate.pop(name, None)
+            if bucket is None:
+                continue
+            removed.extend(bucket)
+            by_subject = self._pos[name]
+            del by_subject[subject]
+            if not by_subject:
+                del self._pos[name]
+        if not by_predicate:
+            del self._spo[subject]
+        self._unindex_objects(removed)
+
+    async def match(
+        self,
+        subject: Optional[str] = None,
+        predicate: Optional[str] = None,
+        object_value: Any = _ANY,
+    ) -> List[Fact]:
+        r"""
+        Returns facts matching a triple pattern; `None` subjects and predicates and an omitted
+        `object_value` act as wildcards.
+
+        Bound subjects resolve through the SPO index, bound predicates through POS and a
+        lone bound object through OSP; only an unhashable object value falls back to a scan.
+
+        Args:
+            subject (`str`, *optional*): The entity to match.
+            predicate (`str`, *optional*): The relationship to match.
+            object_value (`Any`, *optional*):
+                The value to match (compared with `==`); `None` matches facts whose value is `None`.
+                Omit it to match any value.
+
+        Returns:
+            `List[Fact]`: The matching facts.
+        r"""
+        facts: Iterable[Fact]
+        if subject is not None:
+            by_predicate = self._spo.get(subject)
+            if not by_predicate:
+                return []
+            if predicate is not None:
+                facts = by_predicate.get(predicate, ())
+            else:
+                facts = chain.from_iterable(by_predicate.values())
+        elif predicate is not None:
+            by_subject = self._pos.get(predicate)
+            facts = chain.from_iterable(by_subject.values()) if by_subject else ()
+        elif object_value is not _ANY:
+            try:
+                return list(self._osp.get(object_value, ()))
+            except TypeError:
+                facts = self._all_facts()
+        else:
+            return list(self._all_facts())
+
+        if object_value is _ANY:
+            return list(facts)
+        return [fact for fact in facts if fact.object_value == object_value]
+
+    async def query_by_predicate(self, predicate: str) -> List[Fact]:
+        r"""
+        Returns every fact with the given predicate, across all subjects.
+
+        Args:
+            predicate (`str`): The relationship to look up.
+
+        Returns:
+            `List[Fact]`: The matching facts.
+        r"""
+        return await self.match(predicate=predicate)
+
+    async def query_by_object(self, object_value: Any) -> List[Fact]:
+        r"""
+        Returns every fact whose value equals `object_value`.
+
+        Args:
+            object_value (`Any`): The value to look up (compared with `==`).
+
+        Returns:
+            `List[Fact]`: The matching facts.
+        r"""
+        return await self.match(object_value=object_value)
+
+    def _all_facts(self) -> Iterable[Fact]:
+        return chain.from_iterable(bucket for by_predicate in self._spo.values() for bucket in by_predicate.values())
+
+    def _unindex_objects(self, removed: List[Fact]) -> None:
+        r"""Drops removed facts from the object index, touching each affected bucket once."""
+        removed_ids = {id(fact) for fact in removed}
+        values = set()
+        for fact in removed:
+            try:
+                values.add(fact.object_value)
+            except TypeError:
+                continue  # never indexed
+        for value in values:
+            bucket = self._osp.get(value)
+            if bucket is None:
+                continue
+            kept = [fact for fact in bucket if id(fact) not in removed_ids]
+            if kept:
+                self._osp[value] = kept
+            else:
+                del self._osp[value]
+
+
+# (monotonic deadline, earliest fact expiry, facts) for one cached `query` call.
+_CachedQuery = Tuple[Optional[float], Optional[datetime], List[Fact]]
+
+
+class CachedFactStore(FactStore):
+    r"""
+    Wraps another `FactStore` with a bounded LRU cache of `query` results.
+
+    Reasoning loops tend to re-query the same `(subject, predicate)` pairs within a
+    session; with this wrapper repeat queries are served from memory instead of the
+    backing store. Entries expire after `cache_expiration` seconds, or earlier if one of
+    the cached facts reaches its `expires_at`, and writes through the wrapper
+    (`remember`, `remember_many`, `forget`) drop every cached entry for the touched
+    subjects. Writes made directly to the wrapped store bypass invalidation.
+
+    Args:
+        store (`FactStore`): The backing store.
+        cache_entries (`int`, *optional*, defaults to `500`): Maximum cached queries.
+        cache_expiration (`float`, *optional*, defaults to `300.0`):
+            Seconds a cached result stays valid. `None` keeps entries until evicted.
+
+    Example:
+        ```python
+        >>> store = CachedFactStore(InMemoryFactStore(), cache_entries=1000)
+        >>> await store.query("Tesla", "ceo")  # backing store
+        >>> await store.query("Tesla", "ceo")  # cache hit
+        ```
+    r"""
+
+    def __init__(self, store: FactStore, cache_entries: int = 500, cache_expiration: Optional[float] = 300.0):
+        if cache_entries < 1:
+            raise ValueError("cache_entries must be at least 1.")
+        self.store = store
+        self.cache_entries = cache_entries
+        self.cache_expiration = cache_expiration
+        self._cache: OrderedDict[Tuple[str, Optional[str]], _CachedQuery] = OrderedDict()
+
+    async def query(self, subject: str, predicate: Optional[str] = None) -> List[Fact]:
+        r"""
+        Queries facts about a subject, serving repeats from the cache.
+
+        Args:
+            subject (`str`): The entity to query.
+            predicate (`str`, *optional*): The specific relationship to filter by.
+
+        Returns:
+            `List[Fact]`: A list of matching facts.
+        r"""
+        key = (subject, predicate)
+        entry = self._cache.get(key)
+        if entry is not None:
+            deadline, earliest_expiry, facts = entry
+            if (deadline is None or time.monotonic() < deadline) and (
+                earliest_expiry is None or datetime.now(timezone.utc) <= earliest_expiry
+            ):
+                self._cache.move_to_end(key)
+                return list(facts)
+            del self._cache[key]
+
+        facts = await self.store.query(subject, predicate)
+        deadline = None if self.cache_expiration is None else time.monotonic() + self.cache_expiration
+        expiries = [fact.expires_at for fact in facts if fact.expires_at is not None]
+        self._cache[key] = (deadline, min(expiries) if expiries else None, list(facts))
+        if len(self._cache) > self.cache_entries:
+            self._cache.popitem(last=False)
+        return facts
+
+    async def remember(self, fact: Fact) -> None:
+        r"""
+        Stores a fact in the backing store and invalidates its subject.
+
+        Args:
+            fact (`Fact`): The fact object to store.
+        r"""
+        await self.store.remember(fact)
+        self.invalidate(fact.subject)
+
+    async def remember_many(self, facts: Iterable[Fact]) -> None:
+        r"""
+        Stores a batch of facts in the backing store and invalidates their subjects.
+
+        Args:
+            facts (`Iterable[Fact]`): The facts to store, in order.
+        r"""
+        batch = list(facts)
+        await self.store.remember_many(batch)
+        self.invalidate(*{fact.subject for fact in batch})
+
+    async def forget(self, subject: str, predicate: Optional[str] = None) -> None:
+        r"""
+        Removes facts from the backing store and invalidates the subject.
+
+        Args:
+            subject (`str`): The entity whose facts are removed.
+            predicate (`str`, *optional*): Restricts removal to this relationship.
+        r"""
+        await self.store.forget(subject, predicate)
+        self.invalidate(subject)
+
+    async def match(
+        self,
+        subject: Optional[str] = None,
+        predicate: Optional[str] = None,
+        object_value: Any = _ANY,
+    ) -> List[Fact]:
+        r"""
+        Returns facts matching a triple pattern, using the backing store's indexes.
+
+        Only subject-bound patterns without an object go through the query cache.
+
+        Args:
+            subject (`str`, *optional*): The entity to match.
+            predicate (`str`, *optional*): The relationship to match.
+            object_value (`Any`, *optional*):
+                The value to match (compared with `==`); `None` matches facts whose value is `None`.
+                Omit it to match any value.
+
+        Returns:
+            `List[Fact]`: The matching facts.
+        r"""
+        if subject is not None and object_value is _ANY:
+            return await self.query(subject, predicate)
+        return await self.store.match(subject, predicate, object_value)
+
+    def invalidate(self, *subjects: str) -> None:
+        r"""
+        Drops cached queries for the given subjects, or the whole cache if none are given.
+
+        Args:
+            *subjects (`str`): The subjects whose cached queries are dropped.
+        r"""
+        if not subjects:
+            self._cache.clear()
+            return
+        targets = set(subjects)
+        for key in [key for key in self._cache if key[0] in targets]:
+            del self._cache[key]
+
 
-__all__ = ["Fact", "FactStore"]
+__all__ = ["CachedFactStore", "Fact", "FactStore", "InMemoryFactStore", "filter_fresh", "parse_facts"]
@@ -21,9 +21,11 @@ budgets, timeouts, and human review gates.
 """
 
 import asyncio
+import contextlib
 import logging
+import sys
 import time
-from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+from typing import Any, Callable, ContextManager, Dict, Generic, Optional, TypeVar
 
 from xrtm.forecast.core.config.graph import GraphConfig
 from xrtm.forecast.core.interfaces import HumanProvider
@@ -34,6 +36,24 @@ logger = logging.getLogger(__name__)
 
 StateT = TypeVar("StateT", bound=BaseGraphState)
 
+# Packages whose public names resolve lazily through a module `__getattr__`.
+_LAZY_EXPORT_PACKAGES = ("xrtm.forecast", "xrtm.forecast.kit")
+
+
+def _resolve_lazy_exports() -> None:
+    r"""
+    Resolves the deferred exports of the loaded xrtm packages before a clock is frozen.
+
+    Starting a frozen clock makes freezegun getattr() every name in dir() of every loaded
+    module. A deferred export first resolved there would import its Pydantic models against
+    `FakeDatetime`, so backtests resolve them up front while the real clock is in place.
+    r"""
+    for package in _LAZY_EXPORT_PACKAGES:
+        module = sys.modules.get(package)
+        if module is not None:
+            for name in dir(module):
+                getattr(module, name)
+
 
 class Orchestrator(Generic[StateT]):
     r"""
@@ -198,144 +218,149 @@ class Orchestrator(Generic[StateT]):
             if entry_node == "ingestion" and self.entry_point:
                 entry_node = self.entry_point
 
+            # Temporal Sandboxing: the clock is frozen while node bodies and parallel groups run.
+            # Consecutive steps linked by static edges (or a returned node name) form one frozen
+            # segment, so a linear chain enters the sandbox once; the clock is thawed before
+            # conditional-edge callbacks and human waits, which must see real time.
+            sandbox = self._temporal_sandbox(state)
+            frozen = False
             active_node: Optional[str] = entry_node
-            while active_node:
-                next_node = None
-                if state.cycle_count >= self.max_cycles:
-                    logger.warning(
-                        f"[GRAPH] Max cycles ({self.max_cycles}) reached for {state.subject_id}. Terminating."
-                    )
-                    break
-
-                state.cycle_count += 1
-                # Check if active_node is a standard node or a native primitive
-                if active_node in self.nodes:
-                    # Merkle Anchoring: Capture parent state before execution
-                    state.parent_hash = state.state_hash
-
-                    # Standard single node
-                    node_func = self.nodes.get(active_node)
-                    if node_func:
-                        # Temporal Sandboxing: Mock System Clock
-                        if state.temporal_context and state.temporal_context.is_backtest:
-                            from freezegun import freeze_time
-
-                            with freeze_time(state.temporal_context.reference_time):
-                                res = await node_func(state, report_progress)
-                        else:
+            with contextlib.ExitStack() as clock:
+                while active_node:
+                    next_node = None
+                    if state.cycle_count >= self.max_cycles:
+                        logger.warning(
+                            f"[GRAPH] Max cycles ({self.max_cycles}) reached for {state.subject_id}. Terminating."
+                        )
+                        break
+
+                    state.cycle_count += 1
+                    # Check if active_node is a standard node or a native primitive
+                    if active_node in self.nodes:
+                        # Merkle Anchoring: Capture parent state before execution
+                        state.parent_hash = state.state_hash
+
+                        # Standard single node
+                        node_func = self.nodes.get(active_node)
+                        if node_func:
+                            if not frozen:
+                                clock.enter_context(sandbox)
+                                frozen = True
                             res = await node_func(state, report_progress)
 
-                        # Automatically capture node results
-                        state.node_reports[active_node] = res
-
-                        # If the node returned a string, check if it's a valid next node
-                        if isinstance(res, str) and (
-                            res in self.nodes or res in self.parallel_groups or res.startswith("human:")
-                        ):
-                            next_node = res
-                        else:
-                            next_node = None
-                    elif not active_node.startswith("human:"):
-                        logger.error(f"[GRAPH] Unknown node (function is None): {active_node}")
-                        break
+                            # Automatically capture node results
+                            state.node_reports[active_node] = res
 
-                    if active_node.startswith("human:"):
-                        pass  # Fall through to common anchor logic if we move the human logic up
-
-                # Native Primitive: Human Intervention
-                if active_node.startswith("human:"):
-                    prompt = active_node.split("human:", 1)[1]
-                    logger.info(f"[GRAPH] Waiting for human input: {prompt}")
-
-                    # We look for a HumanProvider in the context
-                    provider: Optional[HumanProvider] = state.context.get("human_provider")
-                    if not provider:
-                        logger.error(
-                            "[GRAPH] Human intervention requested but no 'human_provider' found in state context."
-                        )
-                        break
+                            # If the node returned a string, check if it's a valid next node
+                            if isinstance(res, str) and (
+                                res in self.nodes or res in self.parallel_groups or res.startswith("human:")
+                            ):
+                                next_node = res
+                            else:
+                                next_node = None
+                        elif not active_node.startswith("human:"):
+                            logger.error(f"[GRAPH] Unknown node (function is None): {active_node}")
+                            break
 
-                    human_val = await provider.get_human_input(prompt)
-                    state.node_reports[active_node] = human_val
-                    next_node = None
+                        if active_node.startswith("human:"):
+                            pass  # Fall through to common anchor logic if we move the human logic up
 
-                    # Common Anchor Logic (Merkle)
-                    state.execution_path.append(active_node)
-                    state.state_hash = state.compute_hash()
-                    logger.debug(f"[GRAPH] Node '{active_node}' anchored. Hash: {state.state_hash[:8]}...")
-
-                elif active_node in self.nodes and self.nodes.get(active_node) is not None:
-                    # Case handled above, just anchor
-                    state.execution_path.append(active_node)
-                    state.state_hash = state.compute_hash()
-                    logger.debug(f"[GRAPH] Node '{active_node}' anchored. Hash: {state.state_hash[:8]}...")
-
-                elif active_node in self.parallel_groups:
-                    # Merkle Anchoring: Capture parent state before execution
-                    state.parent_hash = state.state_hash
-                    # Parallel Group Execution
-                    group_nodes = self.parallel_groups[active_node]
-                    logger.info(f"[GRAPH] Executing parallel group: {active_node} -> {group_nodes}")
-
-                    tasks = []
-                    for node_name in group_nodes:
-                        func = self.nodes.get(node_name)
-                        if func:
-                            tasks.append(func(state, report_progress))
-                        else:
-                            logger.error(f"[GRAPH] Unknown node in group: {node_name}")
-
-                    # Execute all workers in parallel
-                    if tasks:
-                        # Spawn properly named tasks for telemetry
-                        wrapped_tasks = []
-                        for i, t_coro in enumerate(tasks):
-                            task_name = f"{active_node}:worker_{i}"
-                            wrapped_tasks.append(AsyncRuntime.spawn(t_coro, name=task_name))
-
-                        # Temporal Sandboxing: Mock System Clock
-                        if state.temporal_context and state.temporal_context.is_backtest:
-                            from freezegun import freeze_time
-
-                            with freeze_time(state.temporal_context.reference_time):
-                                results = await asyncio.gather(*wrapped_tasks, return_exceptions=True)
-                        else:
+                    # Native Primitive: Human Intervention
+                    if active_node.startswith("human:"):
+                        if frozen:
+                            clock.close()
+                            frozen = False
+                        prompt = active_node.split("human:", 1)[1]
+                        logger.info(f"[GRAPH] Waiting for human input: {prompt}")
+
+                        # We look for a HumanProvider in the context
+                        provider: Optional[HumanProvider] = state.context.get("human_provider")
+                        if not provider:
+                            logger.error(
+                                "[GRAPH] Human intervention requested but no 'human_provider' found in state context."
+                            )
+                            break
+
+                        human_val = await provider.get_human_input(prompt)
+                        state.node_reports[active_node] = human_val
+                        next_node = None
+
+                        # Common Anchor Logic (Merkle)
+                        state.execution_path.append(active_node)
+                        state.state_hash = state.compute_hash()
+                        logger.debug(f"[GRAPH] Node '{active_node}' anchored. Hash: {state.state_hash[:8]}...")
+
+                    elif active_node in self.nodes and self.nodes.get(active_node) is not None:
+                        # Case handled above, just anchor
+                        state.execution_path.append(active_node)
+                        state.state_hash = state.compute_hash()
+                        logger.debug(f"[GRAPH] Node '{active_node}' anchored. Hash: {state.state_hash[:8]}...")
+
+                    elif active_node in self.parallel_groups:
+                        # Merkle Anchoring: Capture parent state before execution
+                        state.parent_hash = state.state_hash
+                        # Parallel Group Execution
+                        group_nodes = self.parallel_groups[active_node]
+                        logger.info(f"[GRAPH] Executing parallel group: {active_node} -> {group_nodes}")
+
+                        tasks = []
+                        for node_name in group_nodes:
+                            func = self.nodes.get(node_name)
+                            if func:
+                                tasks.append(func(state, report_progress))
+                            else:
+                                logger.error(f"[GRAPH] Unknown node in group: {node_name}")
+
+                        # Execute all workers in parallel
+                        if tasks:
+                            # Spawn properly named tasks for telemetry
+                            wrapped_tasks = []
+                            for i, t_coro in enumerate(tasks):
+                                task_name = f"{active_node}:worker_{i}"
+                                wrapped_tasks.append(AsyncRuntime.spawn(t_coro, name=task_name))
+
+                            if not frozen:
+                                clock.enter_context(sandbox)
+                                frozen = True
                             results = await asyncio.gather(*wrapped_tasks, return_exceptions=True)
 
-                        for i, res in enumerate(results):
-                            if isinstance(res, Exception):
-                                node_name = group_nodes[i] if i < len(group_nodes) else "unknown"
-                                logger.error(f"[GRAPH] Error in parallel node {node_name}: {res}")
-
-                    # Merkle Update: Parallel groups update the state hash once after all workers
-                    state.execution_path.append(f"parallel:{active_node}")
-                    state.state_hash = state.compute_hash()
-
-                else:
-                    logger.error(f"[GRAPH] Unknown flow control: {active_node}")
-                    break
-
-                # If the node didn't explicitly return a next step (or returned None),
-                # check the declarative edge registry, prioritizing conditional edges.
-                if next_node is None:
-                    # 1. Check valid conditional edges
-                    if active_node in self.conditional_edges:
-                        condition_func, route_map = self.conditional_edges[active_node]
-                        try:
-                            route_key = condition_func(state)
-                            next_node = route_map.get(route_key)
-                            if not next_node:
-                                logger.warning(
-                                    f"[GRAPH] Condition returned '{route_key}' but no mapping found for node '{active_node}'"
-                                )
-                        except Exception as e:
-                            logger.error(f"[GRAPH] Conditional edge logic failed for '{active_node}': {e}")
-
-                    # 2. If no conditional match (or no condition), fall back to static edge
-                    if next_node is None:
-                        next_node = self.edges.get(active_node)
+                            for i, res in enumerate(results):
+                                if isinstance(res, Exception):
+                                    node_name = group_nodes[i] if i < len(group_nodes) else "unknown"
+                                    logger.error(f"[GRAPH] Error in parallel node {node_name}: {res}")
 
-                active_node = next_node
+                        # Merkle Update: Parallel groups update the state hash once after all workers
+                        state.execution_path.append(f"parallel:{active_node}")
+                        state.state_hash = state.compute_hash()
+
+                    else:
+                        logger.error(f"[GRAPH] Unknown flow control: {active_node}")
+                        break
+
+                    # If the node didn't explicitly return a next step (or returned None),
+                    # check the declarative edge registry, prioritizing conditional edges.
+                    if next_node is None:
+                        # 1. Check valid conditional edges
+                        if active_node in self.conditional_edges:
+                            if frozen:
+                                clock.close()
+                                frozen = False
+                            condition_func, route_map = self.conditional_edges[active_node]
+                            try:
+                                route_key = condition_func(state)
+                                next_node = route_map.get(route_key)
+                                if not next_node:
+                                    logger.warning(
+                                        f"[GRAPH] Condition returned '{route_key}' but no mapping found for node '{active_node}'"
+                                    )
+                            except Exception as e:
+                                logger.error(f"[GRAPH] Conditional edge logic failed for '{active_node}': {e}")
+
+                        # 2. If no conditional match (or no condition), fall back to static edge
+                        if next_node is None:
+                            next_node = self.edges.get(active_node)
+
+                    active_node = next_node
 
             state.latencies["total_graph"] = time.time() - start_total
             logger.info(f"[GRAPH] Total cycle took {state.latencies['total_graph']:.2f}s")
@@ -344,6 +369,20 @@ class Orchestrator(Generic[StateT]):
 
         return state
 
+    @staticmethod
+    def _temporal_sandbox(state: BaseGraphState) -> ContextManager[Any]:
+        r"""
+        Returns a reusable frozen-clock context for backtests, or a no-op context for live runs.
+
+        The context is built once per run and entered once per frozen segment of `run`.
+        r"""
+        if state.temporal_context and state.temporal_context.is_backtest:
+            from freezegun import freeze_time
+
+            _resolve_lazy_exports()
+            return freeze_time(state.temporal_context.reference_time)
+        return contextlib.nullcontext()
+
     def aggregate_usage(self, state: BaseGraphState, agent_output: Any) -> None:
         r"""
         Aggregates token usage from an agent output into the global graph state.
@@ -16,7 +16,7 @@
 import asyncio
 import logging
 from contextvars import ContextVar
-from typing import Any, Coroutine, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, List, Optional, TypeVar
 
 try:
     import uvloop
@@ -101,6 +101,43 @@ class AsyncRuntime:
         r"""
         return asyncio.TaskGroup()
 
+    @staticmethod
+    async def gather_bounded(
+        coros: Iterable[Awaitable[T]], max_workers: int = 10, return_exceptions: bool = False
+    ) -> List[Any]:
+        r"""
+        Awaits many independent coroutines with at most `max_workers` in flight.
+
+        Use this instead of awaiting provider calls one by one: `N` calls of latency `L`
+        finish in roughly `ceil(N / max_workers) * L` rather than `N * L`, while the cap
+        keeps rate limits and connection pools from being flooded.
+
+        Args:
+            coros (`Iterable[Awaitable[T]]`): The coroutines (or other awaitables) to run.
+            max_workers (`int`, *optional*, defaults to `10`): Maximum concurrent awaits.
+            return_exceptions (`bool`, *optional*, defaults to `False`):
+                Passed to `asyncio.gather`; if `True`, failures are returned in place of results.
+
+        Returns:
+            `List[Any]`: The results, in the same order as `coros`.
+
+        Example:
+            ```python
+            results = await AsyncRuntime.gather_bounded(
+                (agent.run(q) for q in questions), max_workers=8
+            )
+            ```
+        r"""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def bounded(coro: Awaitable[T]) -> T:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(bounded(coro) for coro in coros), return_exceptions=return_exceptions)
+
     @staticmethod
     async def sleep(seconds: float):
         r"""
@@ -114,7 +151,8 @@ class AsyncRuntime:
         # This is the hook where the Guardian/Chronos logic attaches
         context = temporal_context_var.get()
         if context and getattr(context, "is_backtest", False):
-            logger.debug(f"[CHRONOS] Bypassing sleep of {seconds}s in backtest mode.")
+            # Backtests may sleep in tight loops; only format the message if DEBUG is on.
+            logger.debug("[CHRONOS] Bypassing sleep of %ss in backtest mode.", seconds)
             return
 
         await asyncio.sleep(seconds)
@@ -139,11 +177,34 @@ class AsyncRuntime:
                 AsyncRuntime.run_main(main())
             ```
         r"""
-        if _UVLOOP_AVAILABLE:
-            uvloop.install()
-            logger.info("[RUNTIME] uvloop installed and active.")
+        # Hand uvloop to the runner directly instead of swapping the global loop policy.
+        loop_factory = AsyncRuntime.loop_factory()
+        if loop_factory is not None:
+            logger.info("[RUNTIME] Running on uvloop.")
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(entrypoint)
+
+    @staticmethod
+    def loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+        r"""
+        Returns `uvloop`'s event loop factory if it is available, else `None`.
+
+        `run_main` already runs on uvloop. Applications that start their own loop can pass
+        the factory to `asyncio.Runner` (or `asyncio.run` on Python 3.12+) instead of
+        replacing the global loop policy, which `uvloop.install()` does and which is
+        deprecated on Python 3.12+. `None` selects asyncio's default loop. Install the
+        optional dependency with `pip install xrtm-forecast[uvloop]`.
 
-        return asyncio.run(entrypoint)
+        Returns:
+            `Optional[Callable[[], asyncio.AbstractEventLoop]]`: The loop factory, or `None`.
+
+        Example:
+            ```python
+            with asyncio.Runner(loop_factory=AsyncRuntime.loop_factory()) as runner:
+                runner.run(main())
+            ```
+        r"""
+        return uvloop.new_event_loop if _UVLOOP_AVAILABLE else None
 
     @staticmethod
     def current_task_name() -> str:
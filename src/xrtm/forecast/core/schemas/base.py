@@ -104,10 +104,11 @@ class EpisodicExperience(BaseModel):
     input_snapshot: Dict[str, Any] = Field(description="Context available during reasoning.")
     action_taken: str = Field(description="The chosen trajectory or decision.")
 
+    # Placeholders are built from known-good literals, so skip re-validating them.
     reasoning: ReasoningSchema = Field(
-        default_factory=lambda: ReasoningSchema(claim="N/A", evidence=[], risks=[], rationale="N/A")
+        default_factory=lambda: ReasoningSchema.model_construct(claim="N/A", evidence=[], risks=[], rationale="N/A")
     )
-    confidence_metrics: ConfidenceMetrics = Field(default_factory=ConfidenceMetrics)
+    confidence_metrics: ConfidenceMetrics = Field(default_factory=ConfidenceMetrics.model_construct)
 
     outcome_score: Optional[float] = None
     realized_outcome: Optional[str] = None
@@ -23,7 +23,7 @@ for temporal sandboxing during backtests.
 import hashlib
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -48,7 +48,7 @@ class TemporalContext(BaseModel):
     @property
     def today_str(self) -> str:
         r"""Returns YYYY-MM-DD string of the effective time."""
-        return self.now().strftime("%Y-%m-%d")
+        return self.now().date().isoformat()
 
 
 class BaseGraphState(BaseModel):
@@ -146,11 +146,18 @@ class BaseGraphState(BaseModel):
         r"""Backward-compatible setter for the ordered execution trace."""
         self.execution_path = value
 
-    def compute_hash(self) -> str:
+    def compute_hash(self, hasher: Callable[[bytes], Any] = hashlib.sha256) -> str:
         r"""
         Computes a deterministic SHA-256 hash of the current state.
         Excludes volatile fields like 'latencies' or 'usage' if desired,
         but for sovereignty we include everything that impacts the reasoning.
+
+        Args:
+            hasher (`Callable[[bytes], Any]`, *optional*, defaults to `hashlib.sha256`):
+                A `hashlib`-style constructor, e.g. `functools.partial(hashlib.blake2b,
+                digest_size=32)` for faster internal-only audit chains. Hashes are only
+                comparable when computed with the same hasher; `state_hash` and
+                `parent_hash` set by the orchestrator always use SHA-256.
         """
         # We exclude the hash fields themselves from the computation
         # and volatile fields like latencies to ensure consistency across environments
@@ -158,7 +165,7 @@ class BaseGraphState(BaseModel):
 
         # Use deterministic JSON serialization
         encoded = json.dumps(state_dict, sort_keys=True, default=str).encode("utf-8")
-        return hashlib.sha256(encoded).hexdigest()
+        return hasher(encoded).hexdigest()
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -25,6 +25,8 @@ __all__ = ["LeakageGuardian"]
 
 logger = logging.getLogger(__name__)
 
+_YEAR_PATTERN = re.compile(r"\b20\d{2}\b")
+
 
 class LeakageGuardian:
     r"""
@@ -66,7 +68,7 @@ class LeakageGuardian:
             return None
 
         ref_time = state.temporal_context.reference_time
-        ref_date_str = ref_time.strftime("%Y-%m-%d")
+        ref_date_str = ref_time.date().isoformat()
 
         await report_progress(0.7, "Guardian", "SCANNING", f"Checking for leaks post-{ref_date_str}")
 
@@ -112,11 +114,11 @@ class LeakageGuardian:
         """
         # Check for any year > ref_year (simplistic)
         # In a real tool, we'd look for more patterns.
-        years = re.findall(r"\b20\d{2}\b", text)
-        for year_str in years:
-            if int(year_str) > ref_year:
-                return True
-        return False
+        # Stop at the first future year instead of collecting every match.
+        # Every candidate year starts with "20", so texts without it skip the regex entirely.
+        if "20" not in text:
+            return False
+        return any(int(match.group()) > ref_year for match in _YEAR_PATTERN.finditer(text))
 
     async def _semantic_redaction(self, text: str, ref_date: str) -> str:
         r"""
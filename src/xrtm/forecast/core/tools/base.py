@@ -21,15 +21,45 @@ and ``StrandToolWrapper`` for protocol-compatible adapters.
 """
 
 import abc
+import functools
 import inspect
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     from xrtm.forecast.core.schemas.graph import TemporalContext
 
 logger = logging.getLogger(__name__)
 
+_JSON_TYPE_MAP: Dict[Any, str] = {
+    int: "integer",
+    str: "string",
+    bool: "boolean",
+    float: "number",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _signature_fields(fn: Callable) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    r"""
+    Extracts `(name, json_type)` pairs and required names from a callable's signature.
+
+    Registries rebuilt per request wrap the same functions repeatedly, so the
+    `inspect.signature` walk is only paid once per callable. Only immutable tuples
+    are cached; each tool builds its own schema dict from them.
+    """
+    sig = inspect.signature(fn)
+    properties = []
+    required = []
+
+    for name, param in sig.parameters.items():
+        # Default to string if no annotation or complex type
+        properties.append((name, _JSON_TYPE_MAP.get(param.annotation, "string")))
+
+        if param.default == inspect.Parameter.empty:
+            required.append(name)
+    return tuple(properties), tuple(required)
+
 
 class Tool(abc.ABC):
     r"""
@@ -94,7 +124,7 @@ class Tool(abc.ABC):
             return query
 
         # Prevent double-application
-        cutoff_date = temporal_context.reference_time.strftime("%Y-%m-%d")
+        cutoff_date = temporal_context.reference_time.date().isoformat()
         if f"before:{cutoff_date}" in query:
             return query
 
@@ -181,25 +211,16 @@ class FunctionTool(Tool):
         return self.fn(**kwargs)
 
     def _generate_simple_schema(self, fn: Callable) -> Dict[str, Any]:
-        sig = inspect.signature(fn)
-        properties = {}
-        required = []
-
-        type_map = {
-            int: "integer",
-            str: "string",
-            bool: "boolean",
-            float: "number",
+        try:
+            properties, required = _signature_fields(fn)
+        except TypeError:
+            # Unhashable callables cannot be memoized
+            properties, required = _signature_fields.__wrapped__(fn)
+        return {
+            "type": "object",
+            "properties": {name: {"type": json_type} for name, json_type in properties},
+            "required": list(required),
         }
 
-        for name, param in sig.parameters.items():
-            # Default to string if no annotation or complex type
-            json_type = type_map.get(param.annotation, "string")
-            properties[name] = {"type": json_type}
-
-            if param.default == inspect.Parameter.empty:
-                required.append(name)
-        return {"type": "object", "properties": properties, "required": required}
-
 
 __all__ = ["Tool", "StrandToolWrapper", "FunctionTool"]
@@ -21,7 +21,7 @@ LLM function calling.
 """
 
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from xrtm.forecast.core.config.tools import ToolConfig
 from xrtm.forecast.core.tools.base import FunctionTool, StrandToolWrapper, Tool
@@ -42,6 +42,9 @@ class ToolRegistry:
         self.config = config or ToolConfig()
         self._tools: Dict[str, Tool] = {}
         self._skills: Dict[str, Any] = {}
+        # Immutable snapshots of ``_tools``, rebuilt on every write so reads never re-walk the dict
+        self._tool_names: Tuple[str, ...] = ()
+        self._all_tools: Tuple[Tool, ...] = ()
 
     def register_tool(self, tool: Tool):
         r"""
@@ -54,6 +57,8 @@ class ToolRegistry:
         if tool.name in self._tools:
             logger.warning(f"Overwriting tool: {tool.name}")
         self._tools[tool.name] = tool
+        self._tool_names = tuple(self._tools)
+        self._all_tools = tuple(self._tools.values())
         logger.debug(f"Registered tool: {tool.name}")
 
     def register_skill(self, skill: Any):
@@ -93,13 +98,39 @@ class ToolRegistry:
         r"""Retrieves a registered tool by name."""
         return self._tools.get(name)
 
+    def get_many(self, names: Iterable[str]) -> List[Tool]:
+        r"""
+        Retrieves several registered tools in one call, skipping unknown names.
+
+        Args:
+            names (`Iterable[str]`):
+                The tool names to look up, in the order they should be returned.
+
+        Returns:
+            `List[Tool]`: The registered tools matching `names`.
+        r"""
+        tools = self._tools
+        return [tool for tool in map(tools.get, names) if tool is not None]
+
+    def all_tools(self) -> Tuple[Tool, ...]:
+        r"""
+        Returns every registered tool.
+
+        The tuple is a snapshot rebuilt on registration, so repeated calls on the
+        agent hot path return it without touching the registry dict.
+
+        Returns:
+            `Tuple[Tool, ...]`: All registered tools in registration order.
+        r"""
+        return self._all_tools
+
     def get_skill(self, name: str) -> Optional[Any]:
         r"""Retrieves a registered skill by name."""
         return self._skills.get(name)
 
     def list_tools(self) -> List[str]:
         r"""Returns a list of all registered tool names."""
-        return list(self._tools.keys())
+        return list(self._tool_names)
 
     def list_skills(self) -> List[str]:
         r"""Returns a list of all registered skill names."""
@@ -27,6 +27,9 @@ from typing import Any
 
 __all__ = ["robust_clean", "safe_json_dumps"]
 
+# Exact types returned unchanged; subclasses take the general path below.
+_LEAF_TYPES = frozenset({str, int, bool})
+
 
 def robust_clean(obj: Any) -> Any:
     r"""
@@ -37,8 +40,17 @@ def robust_clean(obj: Any) -> Any:
     - Non-serializable objects (converts to str)
     - Strips internal keys (starting with _)
     r"""
-    if obj is None:
-        return None
+    # Fast paths for the plain containers and leaves that make up most telemetry,
+    # dispatched on exact type before any attribute probing.
+    obj_type = type(obj)
+    if obj is None or obj_type in _LEAF_TYPES:
+        return obj
+    if obj_type is dict:
+        return {k: robust_clean(v) for k, v in obj.items() if not k.startswith("_")}
+    if obj_type is list:
+        return [robust_clean(x) for x in obj]
+    if obj_type is float:
+        return obj if math.isfinite(obj) else None
 
     # Handle Pydantic models
     if hasattr(obj, "model_dump"):
@@ -25,8 +25,76 @@ import logging
 import re
 from typing import Any, Optional
 
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Structural characters outside JSON strings; string bodies are skipped with str.find.
+_STRUCTURAL_CHARS = re.compile(r'["{}\[\]]')
+_OPENING_CHARS = re.compile(r"[\{\[]")
+_FENCE_RE = re.compile(r"```(?:json)?\s*([\{\[].*?[\}\]])\s*```", re.DOTALL)
+
+
+def _loads(text: str) -> Any:
+    r"""
+    Decodes JSON with `orjson` when it is installed, falling back to the stdlib decoder.
+
+    The stdlib retry keeps inputs orjson rejects but `json` accepts (e.g. `NaN` or integers
+    beyond 64 bits) parsing exactly as before; both paths raise `json.JSONDecodeError`.
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _string_end(text: str, quote: int) -> int:
+    r"""Returns the index of the unescaped quote closing the string opened at `quote`, or -1."""
+    end = text.find('"', quote + 1)
+    while end != -1:
+        backslashes = 0
+        while text[end - 1 - backslashes] == "\\":
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return end
+        end = text.find('"', end + 1)
+    return -1
+
+
+def _balanced_end(text: str, start: int) -> int:
+    r"""
+    Returns the index just past the bracket span opened at `start`, or -1 if it never closes.
+
+    Tracks nesting depth and skips over JSON string values, so brackets and escaped
+    quotes inside strings do not affect the balance.
+    """
+    depth = 0
+    pos = start
+    while True:
+        match = _STRUCTURAL_CHARS.search(text, pos)
+        if match is None:
+            return -1
+        i = match.start()
+        char = text[i]
+        if char == '"':
+            i = _string_end(text, i)
+            if i == -1:
+                return -1
+        elif char in "{[":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        pos = i + 1
+
 
 def parse_json_markdown(text: str, default: Optional[Any] = None) -> Any:
     r"""
@@ -55,40 +123,27 @@ def parse_json_markdown(text: str, default: Optional[Any] = None) -> Any:
     r"""
     try:
         # 1. Try to find content inside markdown fences
-        pattern = r"```(?:json)?\s*([\{\[].*?[\}\]])\s*```"
-        json_match = re.search(pattern, text, re.DOTALL)
+        json_match = _FENCE_RE.search(text)
         if json_match:
             try:
-                return json.loads(json_match.group(1))
+                return _loads(json_match.group(1))
             except json.JSONDecodeError:
                 pass
 
-        # 2. Fallback: Search for outermost balanced brackets/braces
-        first_idx = -1
-        last_idx = -1
-        for i, char in enumerate(text):
-            if char in "{[":
-                first_idx = i
+        # 2. Fallback: Parse the first balanced {...} / [...] span that is valid JSON,
+        # resuming after each rejected span so the scan stays linear in the text length
+        opening = _OPENING_CHARS.search(text)
+        while opening:
+            end = _balanced_end(text, opening.start())
+            if end == -1:
                 break
-
-        if first_idx != -1:
-            opening_char = text[first_idx]
-            closing_char = "}" if opening_char == "{" else "]"
-
-            for i in range(len(text) - 1, first_idx, -1):
-                if text[i] == closing_char:
-                    last_idx = i + 1
-                    break
-
-        if first_idx != -1 and last_idx != -1:
-            candidate = text[first_idx:last_idx]
             try:
-                return json.loads(candidate)
+                return _loads(text[opening.start() : end])
             except json.JSONDecodeError:
-                pass
+                opening = _OPENING_CHARS.search(text, end)
 
         # 3. Last resort: Try loading the raw text as a string
-        return json.loads(text)
+        return _loads(text)
     except Exception as e:
         logger.warning(f"JSON Parsing Error: {e}")
         return default
@@ -20,6 +20,7 @@ models with optional field overrides, ensuring branch isolation in
 parallel execution topologies.
 """
 
+import copy
 from typing import Any, Dict, TypeVar
 
 from pydantic import BaseModel
@@ -29,6 +30,9 @@ __all__ = ["clone_state"]
 
 T = TypeVar("T", bound=BaseModel)
 
+# Immutable field values that can be shared between branches without copying.
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+
 
 def clone_state(state: T, overrides: Dict[str, Any] | None = None) -> T:
     r"""
@@ -48,18 +52,30 @@ def clone_state(state: T, overrides: Dict[str, Any] | None = None) -> T:
     Raises:
         ValueError: If overrides contains keys that are not in the state model.
     r"""
-    # 1. Deep copy the model to ensure mutable containers (lists, dicts) are distinct
-    new_state = state.model_copy(deep=True)
-
-    # 2. Apply overrides if provided
-    if overrides:
-        # Validate keys first
-        valid_keys = new_state.__class__.model_fields.keys()
-        for key, value in overrides.items():
-            if key not in valid_keys:
-                raise ValueError(f"Cannot override unknown state field: '{key}'")
-
-            # We use setattr for Pydantic models
-            setattr(new_state, key, value)
+    overrides = overrides or {}
+
+    # 1. Validate override keys before doing any copying
+    unknown = overrides.keys() - type(state).model_fields.keys()
+    if unknown:
+        key = next(key for key in overrides if key in unknown)
+        raise ValueError(f"Cannot override unknown state field: '{key}'")
+
+    # 2. Shallow copy (keeps fields_set, extras and private attributes), then deep copy
+    # only the mutable values that are not about to be replaced. A shared memo keeps
+    # objects aliased across fields aliased in the clone, as model_copy(deep=True) does.
+    new_state = state.model_copy()
+    memo: Dict[int, Any] = {}
+    values = new_state.__dict__
+    for key, value in values.items():
+        if key not in overrides and type(value) not in _ATOMIC_TYPES:
+            values[key] = copy.deepcopy(value, memo)
+    for attrs in (new_state.__pydantic_extra__, new_state.__pydantic_private__):
+        if attrs:
+            for key, value in attrs.items():
+                attrs[key] = copy.deepcopy(value, memo)
+
+    # 3. Apply overrides; we use setattr for Pydantic models
+    for key, value in overrides.items():
+        setattr(new_state, key, value)
 
     return new_state
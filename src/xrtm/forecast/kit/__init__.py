@@ -40,11 +40,15 @@ __all__ = [*_NAMESPACE_EXPORTS]
 
 def __getattr__(name: str) -> Any:
     if name in _NAMESPACE_EXPORTS:
-        return import_module(_NAMESPACE_EXPORTS[name])
-    if name in _LEGACY_EXPORTS:
+        value = import_module(_NAMESPACE_EXPORTS[name])
+    elif name in _LEGACY_EXPORTS:
         module_name, attr_name = _LEGACY_EXPORTS[name]
-        return getattr(import_module(module_name), attr_name)
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name), attr_name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
 
 
 def __dir__() -> list[str]:
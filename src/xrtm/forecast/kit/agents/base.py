@@ -20,6 +20,8 @@ providing common state management, tool access, and lifecycle hooks.
 """
 
 import abc
+import functools
+import inspect
 import logging
 import threading
 from typing import Any, Dict, Optional, TypeVar
@@ -34,6 +36,12 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.cache
+def _init_accepts_model(cls: type) -> bool:
+    r"""Whether `cls.__init__` takes a `model` argument; resolved once per class."""
+    return "model" in inspect.signature(cls).parameters
+
+
 class Agent(abc.ABC):
     r"""
     The fundamental building block of the xrtm-forecast engine.
@@ -42,8 +50,9 @@ class Agent(abc.ABC):
     the `Agent` base class. This allows for extreme modularity and recursion, where
     a complex pipeline can be treated as a single agent within a larger graph.
 
-    This implementation includes threading locks for skill management to ensure
-    stability in concurrent execution environments.
+    Skills are stored copy-on-write: writers serialize on a lock and atomically
+    rebind `skills` to a new dict, so lookups never block and always see a
+    consistent snapshot in concurrent execution environments.
 
     Args:
         name (`str`, *optional*):
@@ -54,7 +63,7 @@ class Agent(abc.ABC):
         self.name = name or self.__class__.__name__
         self.skills: Dict[str, Any] = {}
         self.fact_store: Optional[FactStore] = None
-        self._skills_lock = threading.Lock()
+        self._skills_write_lock = threading.Lock()
 
     @classmethod
     def from_config(cls, model: Optional[Any] = None, name: Optional[str] = None, **kwargs) -> "Agent":
@@ -76,8 +85,6 @@ class Agent(abc.ABC):
         Returns:
             `Agent`: A fully initialized agent instance.
         r"""
-        import inspect
-
         from xrtm.forecast.providers.inference.factory import ModelFactory
 
         # Ergonomic Shortcut: Resolve model string into a provider
@@ -85,8 +92,7 @@ class Agent(abc.ABC):
             model = ModelFactory.get_provider(model)
 
         # Basic injection loop: if constructor takes 'model' and we have one, pass it.
-        sig = inspect.signature(cls.__init__)
-        if "model" in sig.parameters and model:
+        if model and _init_accepts_model(cls):
             return cls(model=model, name=name, **kwargs)  # type: ignore[call-arg]
 
         return cls(name=name, **kwargs)
@@ -106,9 +112,11 @@ class Agent(abc.ABC):
             >>> agent.add_skill(web_search_skill)
             ```
         r"""
-        with self._skills_lock:
-            self.skills[skill.name] = skill
-            logger.debug(f"Agent {self.name} equipped with skill: {skill.name}")
+        with self._skills_write_lock:
+            skills = dict(self.skills)
+            skills[skill.name] = skill
+            self.skills = skills
+        logger.debug(f"Agent {self.name} equipped with skill: {skill.name}")
 
     def get_skill(self, name: str) -> Optional[Any]:
         r"""
@@ -121,8 +129,8 @@ class Agent(abc.ABC):
         Returns:
             `Optional[Any]`: The skill instance if found, else `None`.
         r"""
-        with self._skills_lock:
-            return self.skills.get(name)
+        # Lock-free read: `skills` is only ever rebound, never mutated in place
+        return self.skills.get(name)
 
     def set_fact_store(self, fact_store: FactStore) -> None:
         r"""
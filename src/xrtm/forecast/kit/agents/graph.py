@@ -19,9 +19,10 @@ Agent that operates on the causal graph structure, building and
 traversing logical dependency chains between forecast variables.
 """
 
-from typing import Any, Optional
+from typing import Any, Iterable, List, Optional
 
 from xrtm.forecast.core.orchestrator import Orchestrator
+from xrtm.forecast.core.runtime import AsyncRuntime
 from xrtm.forecast.core.schemas.graph import BaseGraphState
 from xrtm.forecast.kit.agents.base import Agent
 
@@ -44,12 +45,48 @@ class GraphAgent(Agent):
         Runs the internal orchestrator.
         Converts input_data into a BaseGraphState context.
         r"""
-        # Create a fresh state for the sub-graph
-        state = BaseGraphState(subject_id=f"subgraph_{self.name}")
-        state.context = {"input": input_data, **kwargs}
-
-        start_node = self.entry_node or self.orchestrator.entry_point or "ingestion"
-        await self.orchestrator.run(state, entry_node=start_node)
+        state = self._build_state(input_data, kwargs)
+        await self.orchestrator.run(state, entry_node=self._start_node())
 
         # Return the final context or a specific output if defined in state
         return state.context.get("output", state.context)
+
+    async def run_many(self, inputs: Iterable[Any], concurrency: int = 32, **kwargs) -> List[Any]:
+        r"""
+        Runs the internal orchestrator once per input, keeping at most `concurrency` in flight.
+
+        Each input gets its own sub-graph state, and runs are scheduled through
+        `AsyncRuntime.gather_bounded` instead of being awaited one after another.
+
+        Args:
+            inputs (`Iterable[Any]`):
+                The inputs to process. Each becomes the `input` of one sub-graph run.
+            concurrency (`int`, *optional*, defaults to `32`):
+                Maximum number of sub-graph runs executing at the same time.
+            **kwargs:
+                Extra context shared by every run.
+
+        Returns:
+            `List[Any]`: The results of each run, in the same order as `inputs`.
+
+        Example:
+            ```python
+            >>> results = await graph_agent.run_many(["q1", "q2", "q3"], concurrency=8)
+            ```
+        r"""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        states = [self._build_state(input_data, kwargs) for input_data in inputs]
+        start_node = self._start_node()
+        await AsyncRuntime.gather_bounded(
+            (self.orchestrator.run(state, entry_node=start_node) for state in states), max_workers=concurrency
+        )
+        return [state.context.get("output", state.context) for state in states]
+
+    def _start_node(self) -> str:
+        return self.entry_node or self.orchestrator.entry_point or "ingestion"
+
+    def _build_state(self, input_data: Any, kwargs: dict) -> BaseGraphState:
+        # Create a fresh state for the sub-graph. States are not pooled: callers may
+        # receive ``state.context`` itself, so a reused state would mutate their result.
+        return BaseGraphState(subject_id=f"subgraph_{self.name}", context={"input": input_data, **kwargs})
@@ -21,7 +21,8 @@ structured output extraction.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Type, TypeVar, Union
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 
@@ -34,6 +35,17 @@ from .base import Agent
 logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
+# Field names per schema class, computed once; weak keys let dynamically created schemas be collected.
+_schema_fields_cache: "WeakKeyDictionary[type, FrozenSet[str]]" = WeakKeyDictionary()
+
+
+def _schema_fields(schema: Type[BaseModel]) -> FrozenSet[str]:
+    r"""Returns the declared field names of a Pydantic schema, cached per class."""
+    fields = _schema_fields_cache.get(schema)
+    if fields is None:
+        fields = _schema_fields_cache[schema] = frozenset(schema.model_fields)
+    return fields
+
 
 class LLMAgent(Agent):
     r"""
@@ -54,6 +66,31 @@ class LLMAgent(Agent):
         super().__init__(name)
         self.model = model
 
+    @property
+    def model(self) -> InferenceProvider:
+        r"""The inference provider backing this agent."""
+        return self._model
+
+    @model.setter
+    def model(self, model: InferenceProvider) -> None:
+        self._model = model
+        self._model_id: str = getattr(model, "model_id", "unknown")
+
+    @model.deleter
+    def model(self) -> None:
+        # Needed by `mock.patch.object(agent, "model", ...)`, which deletes the patch before restoring
+        del self._model
+        del self._model_id
+
+    @property
+    def model_id(self) -> str:
+        r"""
+        The provider's `model_id`, or `"unknown"` if it does not expose one.
+
+        Resolved once whenever `model` is assigned rather than on every read.
+        r"""
+        return self._model_id
+
     def get_tools(self, tool_names: Optional[List[str]] = None) -> List[Any]:
         r"""
         Retrieves tool instances from the global registry for LLM consumption.
@@ -68,17 +105,11 @@ class LLMAgent(Agent):
         r"""
         if tool_names is None:
             # Return all wrapped tool objects
-            return [tool_registry.get_tool(name) for name in tool_registry.list_tools()]
-
-        tools = []
-        for name in tool_names:
-            tool = tool_registry.get_tool(name)
-            if tool:
-                tools.append(tool)
-        return tools
+            return list(tool_registry.all_tools())
+        return tool_registry.get_many(tool_names)
 
     def parse_output(
-        self, text: str, schema: Optional[Type[T]] = None, default: Any = None
+        self, text: str, schema: Optional[Type[T]] = None, default: Any = None, validate: bool = True
     ) -> Union[T, Dict[str, Any]]:
         r"""
         Parses raw text from an LLM response into a structured format.
@@ -93,6 +124,10 @@ class LLMAgent(Agent):
                 The Pydantic model class to validate the output against.
             default (`Any`, *optional*):
                 The value to return if parsing fails.
+            validate (`bool`, *optional*, defaults to `True`):
+                If `False`, the schema instance is built with `model_construct`, skipping
+                type coercion, constraints, and validators. Only use this for schemas whose
+                payloads are validated elsewhere.
 
         Returns:
             `Union[T, Dict[str, Any]]`: The parsed model instance or dictionary.
@@ -114,8 +149,9 @@ class LLMAgent(Agent):
         if schema and isinstance(parsed, dict):
             try:
                 # Filter out keys not in schema to prevent validation errors
-                valid_fields = schema.model_fields.keys()
-                filtered = {k: v for k, v in parsed.items() if k in valid_fields}
+                filtered = {k: parsed[k] for k in parsed.keys() & _schema_fields(schema)}
+                if not validate:
+                    return schema.model_construct(**filtered)
                 return schema(**filtered)
             except Exception as e:
                 logger.warning(f"Schema validation failed: {e}")
@@ -20,6 +20,7 @@ by name, supporting dynamic agent composition in graph topologies.
 """
 
 import logging
+import sys
 from typing import Dict, List, Optional, Union
 
 from .base import Agent
@@ -75,7 +76,8 @@ class AgentRegistry:
         agent_instance = cast(Agent, agent)
 
         name = name or agent_instance.name
-        self._agents[name.lower()] = agent_instance
+        # Only registered keys are interned; lookups lower-case without growing the intern table
+        self._agents[sys.intern(name.lower())] = agent_instance
         logger.info(f"[REGISTRY] Registered agent: {name.upper()}")
 
     def get_agent(self, name: str) -> Optional[Agent]:
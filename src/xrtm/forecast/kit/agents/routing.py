@@ -20,8 +20,14 @@ graph based on state conditions, confidence thresholds, or
 LLM-driven decisions.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, Optional, Union
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel
 
 from xrtm.forecast.providers.inference.base import InferenceProvider
 from xrtm.forecast.providers.inference.factory import ModelFactory
@@ -30,6 +36,119 @@ from .base import Agent
 
 logger = logging.getLogger(__name__)
 
+# Keyword pre-classifier: unambiguous tasks are routed without a router-model round-trip
+_FAST_KEYWORDS = re.compile(
+    r"\b(?:list|define|format|extract|convert|translate|what is|when (?:is|was|did)|where (?:is|was))\b",
+    re.IGNORECASE,
+)
+_SMART_KEYWORDS = re.compile(
+    r"\b(?:prove|derive|explain why|analy[sz]e|synthesi[sz]e|multi-step|step[- ]by[- ]step|trade-?offs?)\b",
+    re.IGNORECASE,
+)
+_FAST_MAX_CHARS = 200
+
+# Router-model prompt, split around the task so each call is a single concatenation
+_COMPLEXITY_PROMPT_HEAD = (
+    "Classify the following task complexity as 'FAST' or 'SMART'.\n"
+    "'FAST': Simple data extraction, formatting, or basic classification.\n"
+    "'SMART': Complex reasoning, multi-step logic, or nuanced synthesis.\n\n"
+    "Task: "
+)
+_COMPLEXITY_PROMPT_TAIL = "\n\nResponse: [FAST/SMART]"
+# Multi-task variant used when several distinct tasks are waiting for the router model
+_BATCH_PROMPT_HEAD = (
+    "Classify the complexity of each task below as 'FAST' or 'SMART'.\n"
+    "'FAST': Simple data extraction, formatting, or basic classification.\n"
+    "'SMART': Complex reasoning, multi-step logic, or nuanced synthesis.\n"
+)
+_BATCH_PROMPT_TAIL = "\nReply with one line per task, in the form 'Task <number>: FAST' or 'Task <number>: SMART'."
+_BATCH_DECISION = re.compile(r"\bTask\s*(\d+)\s*[:.)-]?\s*\**\s*(FAST|SMART)\b", re.IGNORECASE)
+_TASK_PREVIEW_CHARS = 800
+_DECISION_SCAN_CHARS = 64
+
+
+def _fast_classify(text: str) -> Optional[str]:
+    r"""
+    Classifies obvious tasks without calling the router model.
+
+    Returns `"SMART"` when the task asks for reasoning or synthesis, `"FAST"` when a
+    short task only asks for lookup or formatting, and `None` when the heuristics are
+    inconclusive and the router model should decide.
+    """
+    if _SMART_KEYWORDS.search(text):
+        return "SMART"
+    if len(text) < _FAST_MAX_CHARS and _FAST_KEYWORDS.search(text):
+        return "FAST"
+    return None
+
+
+def _parse_decision(text: str) -> str:
+    r"""
+    Normalizes a router-model reply to `"SMART"` or `"FAST"`.
+
+    Only the first `_DECISION_SCAN_CHARS` characters are inspected, so verbose replies
+    cost constant time. The earliest label wins, which keeps a reply that echoes the
+    prompt (mentioning both labels) from being misread; replies with neither label
+    route to `"FAST"`.
+    """
+    head = text[:_DECISION_SCAN_CHARS].upper()
+    smart_at = head.find("SMART")
+    if smart_at < 0:
+        return "FAST"
+    fast_at = head.find("FAST")
+    return "FAST" if 0 <= fast_at < smart_at else "SMART"
+
+
+def _batch_prompt(tasks: Sequence[str]) -> str:
+    r"""Builds one router prompt that numbers each task under a `### Task <n>:` delimiter."""
+    sections = "".join(f"\n### Task {number}:\n{task}\n" for number, task in enumerate(tasks, 1))
+    return _BATCH_PROMPT_HEAD + sections + _BATCH_PROMPT_TAIL
+
+
+def _parse_batch_decisions(text: str, count: int) -> Dict[int, str]:
+    r"""
+    Maps 1-based task numbers to `"FAST"`/`"SMART"` from a multi-task router reply.
+
+    Only `Task <n>: <label>` lines for `1 <= n <= count` are read and the first label per
+    task wins. Tasks the reply does not label are left out, so the caller can re-ask for
+    them instead of guessing.
+    """
+    decisions: Dict[int, str] = {}
+    for match in _BATCH_DECISION.finditer(text):
+        number = int(match.group(1))
+        if 1 <= number <= count and number not in decisions:
+            decisions[number] = match.group(2).upper()
+    return decisions
+
+
+def _truncated_str(obj: Any, limit: int = _TASK_PREVIEW_CHARS) -> str:
+    r"""
+    Renders at most `limit` characters of `obj` for classification.
+
+    Strings are sliced directly. Pydantic models and mappings are rendered field by
+    field as `key=value`, stopping once the budget is spent, so large payloads are
+    never stringified in full just to be cut down to a short preview.
+    """
+    if isinstance(obj, str):
+        return obj[:limit]
+    items: Iterator[Tuple[Any, Any]]
+    if isinstance(obj, BaseModel):
+        items = iter(obj)
+    elif isinstance(obj, Mapping):
+        items = iter(obj.items())
+    else:
+        return str(obj)[:limit]
+
+    parts = []
+    remaining = limit
+    for key, value in items:
+        part = f"{key}={_truncated_str(value, remaining)}"
+        parts.append(part)
+        remaining -= len(part) + 1
+        if remaining <= 0:
+            break
+    return " ".join(parts)[:limit]
+
 
 class RoutingAgent(Agent):
     r"""
@@ -52,6 +171,16 @@ class RoutingAgent(Agent):
             A custom map of route names to agents/providers.
         name (`str`, *optional*):
             Logical name of the router.
+        use_heuristics (`bool`, *optional*, defaults to `True`):
+            Whether to route unambiguous tasks with a keyword pre-classifier before
+            falling back to the router model.
+        decision_cache_size (`int`, *optional*, defaults to `1024`):
+            Maximum number of router-model decisions remembered per task. Set to `0`
+            to disable the cache.
+        router_batch_size (`int`, *optional*, defaults to `32`):
+            Maximum number of distinct tasks classified by one router-model call. Tasks
+            that arrive while a call is in flight are sent together as soon as it returns.
+            Set to `1` to classify every task with its own call.
     r"""
 
     def __init__(
@@ -61,8 +190,23 @@ class RoutingAgent(Agent):
         smart_tier: Optional[Union[Agent, InferenceProvider]] = None,
         routes: Optional[Dict[str, Union[Agent, InferenceProvider]]] = None,
         name: str = "Router",
+        use_heuristics: bool = True,
+        decision_cache_size: int = 1024,
+        router_batch_size: int = 32,
     ):
+        if router_batch_size < 1:
+            raise ValueError("router_batch_size must be at least 1.")
         super().__init__(name=name)
+        self.use_heuristics = use_heuristics
+        self.router_batch_size = router_batch_size
+        # LRU of router-model decisions keyed by a digest of the classified task prefix
+        self._decision_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._cache_max = decision_cache_size
+        # Pending decisions by task digest, so concurrent runs of the same task share one classification
+        self._inflight: Dict[bytes, "asyncio.Future[str]"] = {}
+        # Distinct tasks waiting for the next router call, and the task draining them
+        self._queue: List[Tuple[str, bytes, "asyncio.Future[str]"]] = []
+        self._dispatcher: Optional["asyncio.Task[None]"] = None
         self.router_model = router_model or ModelFactory.get_provider("openai:gpt-4o-mini")
         self.fast_tier = fast_tier
         self.smart_tier = smart_tier
@@ -77,8 +221,9 @@ class RoutingAgent(Agent):
         r"""
         Decides which route to take and executes the task.
 
-        This method first classifies the input task as 'FAST' or 'SMART' using the
-        internal router model, and then dispatches it to the corresponding tier.
+        This method first classifies the input task as 'FAST' or 'SMART', and then
+        dispatches it to the corresponding tier. Obvious tasks are classified by keyword;
+        the internal router model is only consulted when the heuristics are inconclusive.
 
         Args:
             input_data (`Any`):
@@ -96,45 +241,127 @@ class RoutingAgent(Agent):
             ```
         r"""
         # 1. Classification Step
-        complexity_prompt = f"""
-        Classify the following task complexity as 'FAST' or 'SMART'.
-        'FAST': Simple data extraction, formatting, or basic classification.
-        'SMART': Complex reasoning, multi-step logic, or nuanced synthesis.
+        task = _truncated_str(input_data)
+        decision = _fast_classify(task) if self.use_heuristics else None
+        if decision is None:
+            decision = await self._classify(task)
 
-        Task: {str(input_data)[:800]}
-
-        Response: [FAST/SMART]
-        r"""
-
-        try:
-            decision_resp = await self.router_model.run(complexity_prompt)
-            decision = decision_resp.text.upper().strip()
-        except Exception as e:
-            logger.error(f"Routing decision failed: {e}. Falling back to SMART.")
-            decision = "SMART"
-
-        target_route = "smart" if "SMART" in decision else "fast"
+        target_route = "smart" if decision == "SMART" else "fast"
 
         # Fallback if route not defined
         if target_route not in self.routes:
-            logger.warning(f"Route '{target_route}' not defined in {self.name}. Falling back to available routes.")
-            if not self.routes:
+            logger.warning("Route '%s' not defined in %s. Falling back to available routes.", target_route, self.name)
+            fallback_route = next(iter(self.routes), None)
+            if fallback_route is None:
                 raise ValueError(f"RoutingAgent '{self.name}' has no defined routes.")
-            target_route = list(self.routes.keys())[0]
+            target_route = fallback_route
 
         target = self.routes[target_route]
-        logger.info(f"RoutingAgent '{self.name}' [Decision: {decision}] -> Routing to: {target_route}")
+        # Lazy %-formatting: this runs on every dispatch and INFO is usually disabled in production
+        logger.info("RoutingAgent '%s' [Decision: %s] -> Routing to: %s", self.name, decision, target_route)
 
         if isinstance(target, Agent):
             return await target.run(input_data, **kwargs)
-        elif hasattr(target, "run") and callable(getattr(target, "run")):
-            # Handles InferenceProviders or other objects with a .run() method
-            if hasattr(target, "generate_content_async"):
-                return await target.run(str(input_data), **kwargs)
-            else:
-                return await target.run(input_data, **kwargs)
-
-        raise TypeError(f"Target '{target_route}' is not a runnable Agent or Provider: {type(target)}")
+
+        # Handles InferenceProviders or other objects with a .run() method
+        run = getattr(target, "run", None)
+        if not callable(run):
+            raise TypeError(f"Target '{target_route}' is not a runnable Agent or Provider: {type(target)}")
+        payload = str(input_data) if hasattr(target, "generate_content_async") else input_data
+        return await run(payload, **kwargs)
+
+    async def _classify(self, task: str) -> str:
+        r"""
+        Returns the router-model decision for `task`, reusing cached and in-flight answers.
+
+        New tasks are queued for the batch dispatcher, so distinct tasks classified
+        concurrently share one router call.
+        r"""
+        key = hashlib.blake2b(task.encode("utf-8"), digest_size=16).digest()
+        decision = self._decision_cache.get(key)
+        if decision is not None:
+            self._decision_cache.move_to_end(key)
+            return decision
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.get_running_loop().create_future()
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self._queue.append((task, key, pending))
+            if self._dispatcher is None or self._dispatcher.done():
+                self._dispatcher = asyncio.ensure_future(self._dispatch_batches())
+        # Shielded so one cancelled caller does not cancel the classification for the others
+        return await asyncio.shield(pending)
+
+    async def _dispatch_batches(self) -> None:
+        r"""
+        Drains the queue with one router call per batch of up to `router_batch_size` tasks.
+
+        Scheduling is eager: the first batch is whatever was queued when the dispatcher
+        starts, and each later batch is sent as soon as the previous call returns.
+        r"""
+        batch: List[Tuple[str, bytes, "asyncio.Future[str]"]] = []
+        try:
+            while self._queue:
+                batch = self._queue[: self.router_batch_size]
+                del self._queue[: len(batch)]
+                decisions = await self._ask_router_batch([task for task, _, _ in batch])
+                for (_, key, future), decision in zip(batch, decisions):
+                    if decision is None:
+                        decision = "SMART"  # failed calls fall back to SMART and are not cached
+                    elif self._cache_max > 0:
+                        self._decision_cache[key] = decision
+                        if len(self._decision_cache) > self._cache_max:
+                            self._decision_cache.popitem(last=False)
+                    if not future.done():
+                        future.set_result(decision)
+                batch = []
+        except BaseException as error:
+            stranded, self._queue = batch + self._queue, []
+            for _, _, future in stranded:
+                if future.done():
+                    continue
+                if isinstance(error, Exception):
+                    future.set_exception(error)
+                else:
+                    future.cancel()
+            if not isinstance(error, Exception):
+                raise
+        finally:
+            self._dispatcher = None
+
+    async def _ask_router_batch(self, tasks: List[str]) -> List[Optional[str]]:
+        r"""
+        Classifies `tasks` with one router call, returning `None` for tasks that failed.
+
+        A lone task uses the single-task prompt. Tasks a multi-task reply does not label
+        are re-asked one by one rather than guessed, so a malformed reply cannot misroute.
+        r"""
+        if len(tasks) == 1:
+            return [await self._ask_router(tasks[0])]
+        try:
+            decision_resp = await self.router_model.run(_batch_prompt(tasks))
+        except Exception as e:
+            logger.error("Batched routing decision failed: %s. Falling back to SMART.", e)
+            return [None] * len(tasks)
+
+        decisions: Dict[int, Optional[str]] = dict(_parse_batch_decisions(decision_resp.text, len(tasks)))
+        missing = [number for number in range(1, len(tasks) + 1) if number not in decisions]
+        if missing:
+            logger.warning("Router reply labelled %d of %d tasks; re-asking the rest.", len(decisions), len(tasks))
+            retried = await asyncio.gather(*(self._ask_router(tasks[number - 1]) for number in missing))
+            decisions.update(zip(missing, retried))
+        return [decisions[number] for number in range(1, len(tasks) + 1)]
+
+    async def _ask_router(self, task: str) -> Optional[str]:
+        r"""Classifies a single task, returning `None` if the router call fails."""
+        try:
+            decision_resp = await self.router_model.run(_COMPLEXITY_PROMPT_HEAD + task + _COMPLEXITY_PROMPT_TAIL)
+        except Exception as e:
+            logger.error("Routing decision failed: %s. Falling back to SMART.", e)
+            return None
+        return _parse_decision(decision_resp.text)
 
 
 __all__ = ["RoutingAgent"]
@@ -20,16 +20,38 @@ specific subject, combining web research, data retrieval, and
 structured reasoning into a coherent analytical output.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List, Union
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, ValidationError, model_validator
 
+from xrtm.forecast.core.runtime import AsyncRuntime, temporal_context_var
 from xrtm.forecast.core.schemas.forecast import CausalEdge, CausalNode, ForecastOutput, ForecastQuestion, MetadataBase
 from xrtm.forecast.kit.agents.llm import LLMAgent
+from xrtm.forecast.providers.inference.base import InferenceProvider
 
 logger = logging.getLogger(__name__)
 
+# Forecast prompt, split around the dynamic title and context so each call is a plain concatenation
+_PROMPT_HEAD = (
+    "Analyze the following event and provide a probabilistic forecast according to xrtm Governance v1:\nTitle: "
+)
+_PROMPT_MID = "\nContext: "
+_PROMPT_TAIL = (
+    "\n\n"
+    "Provide your response in JSON format matching this schema:\n"
+    "- probability: (float 0-1)\n"
+    "- confidence_interval: {'low': float, 'high': float, 'level': 0.9}\n"
+    "- reasoning: (narrative text)\n"
+    "- causal_nodes: (list of {'node_id': string, 'event': string, 'probability': float, 'description': string})\n"
+    "- causal_edges: (list of {'source': string, 'target': string, 'weight': float})\n"
+    "\n"
+    "Ensure the causal_nodes and causal_edges form a valid Directed Acyclic Graph (DAG) representing your reasoning."
+)
+
 
 def _default_confidence_interval(probability: float = 0.5) -> Dict[str, float]:
     r"""Synthesize a bounded confidence interval for legacy payloads."""
@@ -91,8 +113,29 @@ class ForecastingAnalyst(LLMAgent):
     Note: This is a **Reference Implementation**. Domain experts are encouraged
     to fork and customize the persona, few-shot examples, and structural constraints
     for specific forecasting niches.
+
+    Args:
+        model (`InferenceProvider`):
+            The provider used to perform LLM inference.
+        name (`str`, *optional*):
+            The logical name of the agent. Defaults to the class name.
+        output_cache_size (`int`, *optional*, defaults to `0`):
+            Number of forecasts to remember, keyed by question id, title, description, and the
+            active temporal context (reference time and backtest flag).
+            Repeated questions are answered from the cache, and concurrent runs of the same
+            question share a single analysis. Disabled by default because repeated runs are
+            often used to sample independent forecasts.
     r"""
 
+    SEARCH_CONTEXT_THRESHOLD = 500
+    r"""Context length (in characters) at or above which the `web_search` skill is skipped."""
+
+    def __init__(self, model: InferenceProvider, name: Optional[str] = None, output_cache_size: int = 0):
+        super().__init__(model, name)
+        self.output_cache_size = output_cache_size
+        self._output_cache: OrderedDict[bytes, ForecastOutput] = OrderedDict()
+        self._inflight: Dict[bytes, "asyncio.Task[ForecastOutput]"] = {}
+
     async def run(self, input_data: Union[str, ForecastQuestion], **kwargs: Any) -> ForecastOutput:
         r"""
         Processes a ForecastQuestion (or a raw string) and returns a ForecastOutput.
@@ -105,52 +148,68 @@ class ForecastingAnalyst(LLMAgent):
                 description="Auto-generated from string input.",
             )
 
+        if self.output_cache_size <= 0:
+            return await self._analyze(input_data)
+
+        # The active temporal context is part of the key: in a backtest, skills such as web_search
+        # filter by the reference date, so the same question must not be reused across cutoffs.
+        key_text = f"{input_data.id}\x1f{input_data.title}\x1f{input_data.description}"
+        temporal_context = temporal_context_var.get()
+        if temporal_context is not None:
+            key_text += f"\x1f{temporal_context.reference_time.isoformat()}\x1f{temporal_context.is_backtest}"
+        key = hashlib.blake2b(key_text.encode("utf-8"), digest_size=16).digest()
+        if key in self._output_cache:
+            self._output_cache.move_to_end(key)
+            output = self._output_cache[key]
+        else:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._analyze(input_data))
+                self._inflight[key] = pending
+                pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+            output = await asyncio.shield(pending)
+            self._output_cache[key] = output
+            if len(self._output_cache) > self.output_cache_size:
+                self._output_cache.popitem(last=False)
+        # Each caller gets its own copy so mutating a result never corrupts the cache
+        return output.model_copy(deep=True)
+
+    async def _analyze(self, input_data: ForecastQuestion) -> ForecastOutput:
         context = input_data.description or "No additional context provided."
 
-        # Dynamic Skill Usage: If the agent has a 'web_search' skill, use it to gather more info.
+        # Dynamic Skill Usage: If the agent has a 'web_search' skill, use it to gather more info,
+        # unless the question already ships with substantial or sourced context.
         search_skill = self.get_skill("web_search")
-        if search_skill:
-            logger.info(f"Analyst '{self.name}' is using web_search skill...")
+        if search_skill and len(context) < self.SEARCH_CONTEXT_THRESHOLD and "http" not in context:
+            logger.info("Analyst '%s' is using web_search skill...", self.name)
             skill_result = await search_skill.execute(query=input_data.title)
             context = f"{context}\n\nSearch Findings:\n{skill_result}"
 
-        prompt = f"""
-        Analyze the following event and provide a probabilistic forecast according to xrtm Governance v1:
-        Title: {input_data.title}
-        Context: {context}
-
-        Provide your response in JSON format matching this schema:
-        - probability: (float 0-1)
-        - confidence_interval: {{'low': float, 'high': float, 'level': 0.9}}
-        - reasoning: (narrative text)
-        - causal_nodes: (list of {{'node_id': string, 'event': string, 'probability': float, 'description': string}})
-        - causal_edges: (list of {{'source': string, 'target': string, 'weight': float}})
-
-        Ensure the causal_nodes and causal_edges form a valid Directed Acyclic Graph (DAG) representing your reasoning.
-        """
-
+        prompt = _PROMPT_HEAD + input_data.title + _PROMPT_MID + context + _PROMPT_TAIL
         response = await self.model.generate_content_async(prompt)
-        parsed = self.parse_output(response.text, schema=AnalystOutput)
-
-        # Defaults for safe fallback
-        probability = 0.5
-        confidence_interval = _default_confidence_interval(probability)
-        reasoning = "Parsing failed."
-        nodes = []
-        edges = []
-
+        parsed: Any
+        try:
+            # Fast path: a bare JSON reply is parsed and validated in pydantic-core in one pass
+            parsed = AnalystOutput.model_validate_json(response.text)
+        except ValidationError:
+            # Fenced, prefixed, or schema-invalid replies go through the tolerant parser
+            parsed = self.parse_output(response.text, schema=AnalystOutput)
+
+        # Validated models and the raw dict returned on validation failure share one extraction
+        # path; anything else (unparseable text) falls back to neutral defaults.
+        fields: Dict[str, Any]
         if isinstance(parsed, AnalystOutput):
-            probability = parsed.probability
-            confidence_interval = parsed.confidence_interval
-            reasoning = parsed.reasoning
-            nodes = [CausalNode(**n) for n in parsed.causal_nodes]
-            edges = [_sanitize_edge(e) for e in parsed.causal_edges]
+            fields = vars(parsed)
         elif isinstance(parsed, dict):
-            probability = parsed.get("probability", 0.5)
-            confidence_interval = parsed.get("confidence_interval", _default_confidence_interval(probability))
-            reasoning = parsed.get("reasoning", "Parsing failed fallback.")
-            nodes = [CausalNode(**n) for n in parsed.get("causal_nodes", [])]
-            edges = [_sanitize_edge(e) for e in parsed.get("causal_edges", [])]
+            fields = parsed
+        else:
+            fields = {"reasoning": "Parsing failed."}
+
+        probability = fields.get("probability", 0.5)
+        confidence_interval = fields.get("confidence_interval") or _default_confidence_interval(probability)
+        reasoning = fields.get("reasoning", "Parsing failed fallback.")
+        nodes = [CausalNode(**n) for n in fields.get("causal_nodes", [])]
+        edges = [_sanitize_edge(e) for e in fields.get("causal_edges", [])]
 
         # Wrap the parsed output into the standardized ForecastOutput
         return ForecastOutput(
@@ -161,10 +220,41 @@ class ForecastingAnalyst(LLMAgent):
             logical_trace=nodes,
             logical_edges=edges,
             metadata=MetadataBase(
-                source_version=getattr(self.model, "model_id", "unknown"),
+                source_version=self.model_id,
                 raw_data={"token_usage": getattr(response, "usage", {})},
             ),
         )
 
+    async def run_many(
+        self, questions: Iterable[Union[str, ForecastQuestion]], concurrency: int = 32, **kwargs: Any
+    ) -> List[ForecastOutput]:
+        r"""
+        Forecasts several questions concurrently, keeping at most `concurrency` in flight.
+
+        Backtests and evaluation harnesses submit hundreds of questions; awaiting `run`
+        one question at a time serializes every provider round-trip. Runs are scheduled
+        through `AsyncRuntime.gather_bounded`, which starts the next question as soon as
+        one completes.
+
+        Args:
+            questions (`Iterable[Union[str, ForecastQuestion]]`):
+                The questions to forecast.
+            concurrency (`int`, *optional*, defaults to `32`):
+                Maximum number of questions analyzed at the same time.
+            **kwargs:
+                Extra arguments forwarded to each `run` call.
+
+        Returns:
+            `List[ForecastOutput]`: One forecast per question, in input order.
+
+        Example:
+            ```python
+            >>> outputs = await analyst.run_many(questions, concurrency=8)
+            ```
+        r"""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        return await AsyncRuntime.gather_bounded((self.run(q, **kwargs) for q in questions), max_workers=concurrency)
+
 
 __all__ = ["ForecastingAnalyst"]
@@ -21,11 +21,45 @@ back into the graph state.
 """
 
 import inspect
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Literal, Optional
 
 from xrtm.forecast.kit.agents.base import Agent
 
 
+def _specialize(fn: Callable, is_async: bool, mode: str) -> Callable[[Any], Awaitable[Any]]:
+    r"""Builds the awaitable dispatcher for `fn` so `ToolAgent.run` does no per-call branching."""
+    if mode not in ("auto", "kwargs", "positional"):
+        raise ValueError(f"Unknown ToolAgent mode: {mode!r}")
+
+    if is_async:
+        if mode == "positional":
+            return fn
+        if mode == "kwargs":
+            return lambda input_data: fn(**input_data)
+        return lambda input_data: fn(**input_data) if isinstance(input_data, dict) else fn(input_data)
+
+    if mode == "positional":
+
+        async def call_positional(input_data: Any) -> Any:
+            return fn(input_data)
+
+        return call_positional
+
+    if mode == "kwargs":
+
+        async def call_kwargs(input_data: Any) -> Any:
+            return fn(**input_data)
+
+        return call_kwargs
+
+    async def call_auto(input_data: Any) -> Any:
+        if isinstance(input_data, dict):
+            return fn(**input_data)
+        return fn(input_data)
+
+    return call_auto
+
+
 class ToolAgent(Agent):
     r"""
     A specialized Agent that wraps a deterministic Python function or Tool.
@@ -39,19 +73,48 @@ class ToolAgent(Agent):
             The function or tool to be wrapped. Can be synchronous or asynchronous.
         name (`str`, *optional*):
             The logical name of the agent. Defaults to the function's `__name__`.
+        mode (`str`, *optional*, defaults to `"auto"`):
+            How `input_data` is passed to `fn`. `"auto"` unpacks dictionaries as keyword
+            arguments and passes anything else positionally; `"kwargs"` always unpacks;
+            `"positional"` always passes the input as a single argument.
     r"""
 
-    def __init__(self, fn: Callable, name: Optional[str] = None):
+    def __init__(
+        self,
+        fn: Callable,
+        name: Optional[str] = None,
+        mode: Literal["auto", "kwargs", "positional"] = "auto",
+    ):
         super().__init__(name or fn.__name__)
+        self._mode = mode
         self.fn = fn
 
+    @property
+    def fn(self) -> Callable:
+        r"""The wrapped function. Reassigning it re-resolves the calling convention."""
+        return self._fn
+
+    @fn.setter
+    def fn(self, fn: Callable) -> None:
+        # Resolve the calling convention once per function rather than on every `run`
+        self._is_async = inspect.iscoroutinefunction(fn)
+        self._call = _specialize(fn, self._is_async, self._mode)
+        self._fn = fn
+
+    @fn.deleter
+    def fn(self) -> None:
+        # Needed by `mock.patch.object(agent, "fn", ...)`, which deletes the patch before restoring
+        del self._fn
+        del self._is_async
+        del self._call
+
     async def run(self, input_data: Any, **kwargs) -> Any:
         r"""
         Executes the wrapped function with the provided input.
 
-        This method automatically detects if the function is asynchronous and
-        handles the dispatch accordingly. If `input_data` is a dictionary,
-        it will be unpacked as keyword arguments.
+        Sync/async handling and argument passing are resolved at construction
+        time (see `mode`). In the default `"auto"` mode, a dictionary `input_data`
+        is unpacked as keyword arguments.
 
         Args:
             input_data (`Any`):
@@ -63,15 +126,7 @@ class ToolAgent(Agent):
         Returns:
             `Any`: The return value of the wrapped function.
         r"""
-        # Handling for both async and sync functions
-        if inspect.iscoroutinefunction(self.fn):
-            if isinstance(input_data, dict):
-                return await self.fn(**input_data)
-            return await self.fn(input_data)
-        else:
-            if isinstance(input_data, dict):
-                return self.fn(**input_data)
-            return self.fn(input_data)
+        return await self._call(input_data)
 
 
 __all__ = ["ToolAgent"]
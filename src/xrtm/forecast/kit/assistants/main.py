@@ -22,17 +22,17 @@ the abstract integrity of the core engine.
 r"""
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from xrtm.forecast.kit.agents.specialists.analyst import ForecastingAnalyst
-from xrtm.forecast.providers.inference.factory import ModelFactory
+if TYPE_CHECKING:
+    from xrtm.forecast.kit.agents.specialists.analyst import ForecastingAnalyst
 
 logger = logging.getLogger(__name__)
 
 
 def create_forecasting_analyst(
     model_id: str = "openai:gpt-4o-mini", name: Optional[str] = None, **kwargs
-) -> ForecastingAnalyst:
+) -> "ForecastingAnalyst":
     r"""
     A high-level factory to create a pre-configured Forecasting Analyst.
 
@@ -48,6 +48,10 @@ def create_forecasting_analyst(
     Returns:
         `ForecastingAnalyst`: A fully wired specialist agent.
     r"""
+    # Deferred so importing the assistants does not load the agent and provider stacks
+    from xrtm.forecast.kit.agents.specialists.analyst import ForecastingAnalyst
+    from xrtm.forecast.providers.inference.factory import ModelFactory
+
     logger.debug(f"Creating pre-configured ForecastingAnalyst with model: {model_id}")
     model = ModelFactory.get_provider(model_id)
     return ForecastingAnalyst(model=model, name=name, **kwargs)
@@ -17,7 +17,7 @@ r"""Internal policy helpers for inference provider resolution."""
 
 from dataclasses import dataclass
 from importlib import import_module
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from pydantic import SecretStr
 
@@ -89,6 +89,22 @@ def normalize_provider_type(provider_type: Optional[str]) -> str:
     return canonical
 
 
+def coerce_api_key(api_key: Optional[Union[str, SecretStr]]) -> Optional[SecretStr]:
+    r"""
+    Wraps a provider API key in `SecretStr` exactly once.
+
+    Args:
+        api_key (`str | SecretStr | None`): A plain key, an already wrapped key, or `None`.
+
+    Returns:
+        `Optional[SecretStr]`: `None` for `None`, the same object for a `SecretStr`, and a new
+        `SecretStr` around a plain string.
+    r"""
+    if api_key is None or isinstance(api_key, SecretStr):
+        return api_key
+    return SecretStr(api_key)
+
+
 def split_config_kwargs(
     config_type: type[ProviderConfig],
     kwargs: dict[str, Any],
@@ -109,7 +125,7 @@ def build_config(
     config_kwargs, provider_kwargs = split_config_kwargs(spec.config_type, kwargs)
     config_kwargs.setdefault("model_id", model_id or spec.default_model_id)
     if api_key is not None:
-        config_kwargs["api_key"] = api_key
+        config_kwargs["api_key"] = coerce_api_key(api_key)
     return spec.config_type(**config_kwargs), provider_kwargs
 
 
@@ -123,7 +139,8 @@ def update_config(
     if model_id is not None:
         config_kwargs["model_id"] = model_id
     if api_key is not None:
-        config_kwargs["api_key"] = api_key
+        # model_copy(update=...) skips validation, so wrap plain strings here exactly once
+        config_kwargs["api_key"] = coerce_api_key(api_key)
     if config_kwargs:
         config = config.model_copy(update=config_kwargs)
     return config, provider_kwargs
@@ -174,6 +191,7 @@ def instantiate_provider(config: ProviderConfig, provider_kwargs: dict[str, Any]
 __all__ = [
     "apply_environment_profile",
     "build_config",
+    "coerce_api_key",
     "coerce_provider_request",
     "inject_api_key_from_settings",
     "instantiate_provider",
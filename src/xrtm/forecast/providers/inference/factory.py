@@ -73,7 +73,7 @@ class ModelFactory:
             `InferenceProvider`: An instantiated provider.
         r"""
         from xrtm.forecast.core.config.inference import ProviderConfig
-        from xrtm.forecast.core.config.main import settings
+        from xrtm.forecast.core.config.main import get_settings
 
         request_kwargs = dict(kwargs)
         env_profile = request_kwargs.pop("env", None)
@@ -89,7 +89,7 @@ class ModelFactory:
         if env_profile:
             logger.info(f"Applying Environment Profile: {env_profile}")
         config = apply_environment_profile(config, env_profile)
-        config = inject_api_key_from_settings(config, settings)
+        config = inject_api_key_from_settings(config, get_settings())
         return instantiate_provider(config, provider_kwargs)
 
 
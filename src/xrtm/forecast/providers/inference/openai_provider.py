@@ -22,6 +22,7 @@ and structured output with JSON mode.
 
 import asyncio
 import logging
+import random
 from typing import Any, AsyncGenerator, AsyncIterable, Dict, Iterable, List, Optional, cast
 
 from openai import AsyncOpenAI, OpenAI
@@ -32,6 +33,25 @@ from xrtm.forecast.providers.inference.base import InferenceProvider, ModelRespo
 
 logger = logging.getLogger(__name__)
 
+# Retries of a failed completion call use decorrelated-jitter backoff: each wait is
+# drawn from [_RETRY_BASE_WAIT, 3 * previous wait], capped at _RETRY_MAX_WAIT.
+_MAX_RETRIES = 2
+_RETRY_BASE_WAIT = 1.0
+_RETRY_MAX_WAIT = 8.0
+
+_EMPTY_USAGE = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+
+def _usage_dict(usage: Any) -> Dict[str, int]:
+    r"""Flattens an OpenAI usage object, copying the zero template when it is absent."""
+    if not usage:
+        return _EMPTY_USAGE.copy()
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+
 
 class OpenAIProvider(InferenceProvider):
     r"""
@@ -130,30 +150,18 @@ class OpenAIProvider(InferenceProvider):
         while current_turn < max_tool_turns:
             current_turn += 1
 
-            # Retry loop for transient API errors (timeouts, rate limits)
-            max_retries = 2
-            for attempt in range(max_retries + 1):
-                try:
-                    response = await self.client.chat.completions.create(
-                        model=self.model_id,
-                        messages=messages,
-                        tools=cast(Any, openai_tools),
-                        logprobs=output_logprobs,
-                        top_logprobs=5 if output_logprobs else None,
-                        **kwargs,
-                    )
-                    break
-                except Exception as exc:
-                    if attempt < max_retries:
-                        wait = 2 ** attempt
-                        logger.warning(f"[OPENAI] API error, retry {attempt+1}/{max_retries} in {wait}s: {exc}")
-                        await asyncio.sleep(wait)
-                    else:
-                        raise
+            response = await self._create_with_retry(
+                model=self.model_id,
+                messages=messages,
+                tools=cast(Any, openai_tools),
+                logprobs=output_logprobs,
+                top_logprobs=5 if output_logprobs else None,
+                **kwargs,
+            )
 
             choice = response.choices[0]
             if choice.message.tool_calls:
-                logger.info(f"[OPENAI] Detected {len(choice.message.tool_calls)} tool calls. Turn {current_turn}")
+                logger.info("[OPENAI] Detected %d tool calls. Turn %d", len(choice.message.tool_calls), current_turn)
                 messages.append(choice.message)
                 tool_outputs = await self._execute_tool_calls(choice.message.tool_calls, tools or [])
                 messages.extend(tool_outputs)
@@ -161,18 +169,12 @@ class OpenAIProvider(InferenceProvider):
 
             text = choice.message.content or ""
             normalized_logprobs = None
-            if output_logprobs and choice.logprobs and choice.logprobs.content:
-                normalized_logprobs = []
-                for lp in choice.logprobs.content:
-                    normalized_logprobs.append({"token": lp.token, "logprob": lp.logprob})
-
-            usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-            if response.usage:
-                usage = {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
-                }
+            if output_logprobs and choice.logprobs:
+                token_logprobs = choice.logprobs.content
+                if token_logprobs:
+                    normalized_logprobs = [{"token": lp.token, "logprob": lp.logprob} for lp in token_logprobs]
+
+            usage = _usage_dict(response.usage)
 
             if cache_key and self.cache:
                 self.cache.set(cache_key, text, {"model": self.model_id})
@@ -183,24 +185,36 @@ class OpenAIProvider(InferenceProvider):
 
         raise ProviderError(f"OpenAI generation failed: Max tool turns ({max_tool_turns}) exceeded.")
 
+    async def _create_with_retry(self, **request: Any) -> Any:
+        r"""Calls the chat completions API, retrying transient errors (timeouts, rate limits)."""
+        wait = _RETRY_BASE_WAIT
+        for attempt in range(1, _MAX_RETRIES + 1):
+            try:
+                return await self.client.chat.completions.create(**request)
+            except Exception as exc:
+                wait = min(_RETRY_MAX_WAIT, random.uniform(_RETRY_BASE_WAIT, wait * 3))
+                logger.warning("[OPENAI] API error, retry %d/%d in %.2fs: %s", attempt, _MAX_RETRIES, wait, exc)
+                await asyncio.sleep(wait)
+        return await self.client.chat.completions.create(**request)
+
     async def _execute_tool_calls(self, tool_calls: List[Any], tools: List[Any]) -> List[Dict[str, Any]]:
         r"""Executes tool calls and returns OpenAI-formatted tool results."""
         results = []
         import json
 
+        # Index the tools once per batch; the first tool carrying a name wins, as before.
+        tools_by_name: Dict[str, Any] = {}
+        for t in tools:
+            if hasattr(t, "name"):
+                tools_by_name.setdefault(t.name, t)
+            func_name = getattr(t, "__name__", None)
+            if func_name is not None:
+                tools_by_name.setdefault(func_name, t)
+
         for call in tool_calls:
             tool_name = call.function.name
             args = json.loads(call.function.arguments)
-
-            # Find tool in the list
-            target_tool = None
-            for t in tools:
-                if hasattr(t, "name") and t.name == tool_name:
-                    target_tool = t
-                    break
-                if getattr(t, "__name__", None) == tool_name:
-                    target_tool = t
-                    break
+            target_tool = tools_by_name.get(tool_name)
 
             if target_tool:
                 try:
@@ -212,7 +226,7 @@ class OpenAIProvider(InferenceProvider):
                         output = target_tool(**args)
                     result_str = str(output)
                 except Exception as e:
-                    logger.error(f"Error executing tool {tool_name}: {e}")
+                    logger.error("Error executing tool %s: %s", tool_name, e)
                     result_str = f"Error: {e}"
             else:
                 result_str = f"Error: Tool {tool_name} not found."
@@ -260,13 +274,7 @@ class OpenAIProvider(InferenceProvider):
         )
 
         choice = response.choices[0]
-        usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-        if response.usage:
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
+        usage = _usage_dict(response.usage)
 
         text = choice.message.content or ""
         if cache_key and self.cache:
@@ -286,7 +294,7 @@ class OpenAIProvider(InferenceProvider):
         try:
             return self.cache.compute_chat_key(self.model_id, messages, **kwargs)
         except (TypeError, ValueError) as e:
-            logger.debug(f"[OPENAI] Request is not cacheable: {e}")
+            logger.debug("[OPENAI] Request is not cacheable: %s", e)
             return None
 
     async def _iter_stream_chunks(self, stream: Any) -> AsyncGenerator[Any, None]:
@@ -337,8 +345,13 @@ class OpenAIProvider(InferenceProvider):
         completed = False
         try:
             async for chunk in chunks:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield {"contentBlockDelta": {"delta": {"text": chunk.choices[0].delta.content}}}
+                # Walk choices -> delta -> content once per token instead of twice
+                choices = chunk.choices
+                if not choices:
+                    continue
+                text = choices[0].delta.content
+                if text:
+                    yield {"contentBlockDelta": {"delta": {"text": text}}}
             completed = True
         finally:
             await chunks.aclose()
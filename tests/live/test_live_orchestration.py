@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import os
 from typing import Any, cast
 
@@ -22,6 +21,7 @@ from pydantic import SecretStr
 
 from xrtm.forecast.core.config.inference import OpenAIConfig
 from xrtm.forecast.core.orchestrator import Orchestrator
+from xrtm.forecast.core.runtime import AsyncRuntime
 from xrtm.forecast.core.schemas.graph import BaseGraphState
 from xrtm.forecast.providers.inference.factory import ModelFactory
 
@@ -121,4 +121,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    AsyncRuntime.run_main(main())
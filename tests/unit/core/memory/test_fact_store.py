@@ -0,0 +1,344 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+import pytest
+
+from xrtm.forecast.core.memory import graph
+from xrtm.forecast.core.memory.graph import CachedFactStore, Fact, FactStore, InMemoryFactStore
+
+
+def fact(subject: str, predicate: str, value) -> Fact:
+    return Fact(subject=subject, predicate=predicate, object_value=value)
+
+
+async def seeded_store() -> InMemoryFactStore:
+    store = InMemoryFactStore()
+    for item in [
+        fact("Tesla", "ceo", "Elon Musk"),
+        fact("Tesla", "hq", "Austin"),
+        fact("SpaceX", "ceo", "Elon Musk"),
+        fact("Dell", "hq", "Austin"),
+        fact("Dell", "tags", ["hardware"]),
+    ]:
+        await store.remember(item)
+    return store
+
+
+class SubjectOnlyStore(FactStore):
+    r"""Minimal store relying on the `FactStore` default `match`."""
+
+    def __init__(self, facts: List[Fact]):
+        self.facts = facts
+
+    async def remember(self, fact: Fact) -> None:
+        self.facts.append(fact)
+
+    async def query(self, subject: str, predicate: Optional[str] = None) -> List[Fact]:
+        return [f for f in self.facts if f.subject == subject and predicate in (None, f.predicate)]
+
+    async def forget(self, subject: str, predicate: Optional[str] = None) -> None:
+        self.facts = [f for f in self.facts if not (f.subject == subject and predicate in (None, f.predicate))]
+
+
+class TestFactStoreDefaultMatch:
+    r"""Unit tests for the ABC's subject-bound `match` fallback."""
+
+    @pytest.mark.asyncio
+    async def test_match_filters_query_results_by_object(self):
+        r"""A bound subject is answered through `query`."""
+        store = SubjectOnlyStore([fact("Tesla", "ceo", "Elon Musk"), fact("Tesla", "hq", "Austin")])
+
+        assert [f.predicate for f in await store.match("Tesla")] == ["ceo", "hq"]
+        assert [f.predicate for f in await store.match("Tesla", object_value="Austin")] == ["hq"]
+
+    @pytest.mark.asyncio
+    async def test_default_match_can_select_none_values(self):
+        r"""A bound subject with `object_value=None` keeps only facts whose value is `None`."""
+        store = SubjectOnlyStore([fact("Tesla", "ceo", "Elon Musk"), fact("Tesla", "cfo", None)])
+
+        assert [f.predicate for f in await store.match("Tesla", object_value=None)] == ["cfo"]
+
+    @pytest.mark.asyncio
+    async def test_get_single_returns_last_query_result(self):
+        r"""The default point lookup falls back to `query`."""
+        store = SubjectOnlyStore([fact("Tesla", "ceo", "Old CEO"), fact("Tesla", "ceo", "Elon Musk")])
+
+        assert (await store.get_single("Tesla", "ceo")).object_value == "Elon Musk"
+        assert await store.get_single("Tesla", "hq") is None
+
+    @pytest.mark.asyncio
+    async def test_remember_many_defaults_to_remember(self):
+        r"""The default bulk write stores every fact in order."""
+        store = SubjectOnlyStore([])
+
+        await store.remember_many(fact("Tesla", p, p.upper()) for p in ["ceo", "hq"])
+
+        assert [f.predicate for f in store.facts] == ["ceo", "hq"]
+
+    @pytest.mark.asyncio
+    async def test_unbound_subject_is_not_supported(self):
+        r"""Stores without indexes refuse predicate/object-only patterns."""
+        store = SubjectOnlyStore([])
+
+        with pytest.raises(NotImplementedError, match="SubjectOnlyStore"):
+            await store.match(predicate="ceo")
+
+    def test_interface_does_not_require_index_lookups(self):
+        r"""Predicate/object helpers belong to indexed stores, not to every `FactStore`."""
+        assert not hasattr(SubjectOnlyStore([]), "query_by_predicate")
+        assert not hasattr(SubjectOnlyStore([]), "query_by_object")
+
+
+class TestInMemoryFactStore:
+    r"""Unit tests for the indexed in-memory fact store."""
+
+    @pytest.mark.asyncio
+    async def test_query_by_subject_and_predicate(self):
+        r"""`query` keeps its subject/predicate contract."""
+        store = await seeded_store()
+
+        assert [f.predicate for f in await store.query("Tesla")] == ["ceo", "hq"]
+        assert [f.object_value for f in await store.query("Tesla", "hq")] == ["Austin"]
+        assert await store.query("Unknown") == []
+
+    @pytest.mark.asyncio
+    async def test_query_by_predicate_spans_subjects(self):
+        r"""The POS index returns every subject's facts for a predicate."""
+        store = await seeded_store()
+
+        assert sorted(f.subject for f in await store.query_by_predicate("ceo")) == ["SpaceX", "Tesla"]
+        assert await store.query_by_predicate("missing") == []
+
+    @pytest.mark.asyncio
+    async def test_query_by_object_uses_value_equality(self):
+        r"""The OSP index returns every fact with an equal value."""
+        store = await seeded_store()
+
+        assert sorted(f.subject for f in await store.query_by_object("Austin")) == ["Dell", "Tesla"]
+        assert [f.subject for f in await store.query_by_object(["hardware"])] == ["Dell"]
+
+    @pytest.mark.asyncio
+    async def test_match_combines_bound_terms(self):
+        r"""Partially bound patterns intersect all bound terms."""
+        store = await seeded_store()
+
+        assert [f.subject for f in await store.match(predicate="hq", object_value="Austin")] == ["Tesla", "Dell"]
+        assert await store.match("Tesla", "ceo", "Someone else") == []
+        assert len(await store.match()) == len(store) == 5
+
+    @pytest.mark.asyncio
+    async def test_get_single_reads_latest_fact_from_bucket(self):
+        r"""Point lookups return the most recent fact for the pair."""
+        store = await seeded_store()
+        await store.remember(fact("Tesla", "hq", "Palo Alto"))
+
+        assert (await store.get_single("Tesla", "hq")).object_value == "Palo Alto"
+        assert await store.get_single("Tesla", "cfo") is None
+        assert await store.get_single("Unknown", "hq") is None
+
+    @pytest.mark.asyncio
+    async def test_get_single_breaks_ties_by_remember_order(self):
+        r"""The last remembered fact wins even if an earlier one was verified later."""
+        store = InMemoryFactStore()
+        newer = Fact(subject="Tesla", predicate="ceo", object_value="New", verified_at=datetime(2025, 1, 1))
+        older = Fact(subject="Tesla", predicate="ceo", object_value="Old", verified_at=datetime(2020, 1, 1))
+        await store.remember(newer)
+        await store.remember(older)
+
+        assert await store.get_single("Tesla", "ceo") is older
+
+    @pytest.mark.asyncio
+    async def test_match_can_select_none_values(self):
+        r"""`object_value=None` matches facts whose value is `None`; omitting it matches any value."""
+        store = await seeded_store()
+        await store.remember(fact("Tesla", "cfo", None))
+        await store.remember(fact("Dell", "cfo", None))
+
+        assert [f.subject for f in await store.match(object_value=None)] == ["Tesla", "Dell"]
+        assert [f.predicate for f in await store.match("Tesla", object_value=None)] == ["cfo"]
+        assert [f.subject for f in await store.match(predicate="cfo", object_value=None)] == ["Tesla", "Dell"]
+        assert [f.subject for f in await store.query_by_object(None)] == ["Tesla", "Dell"]
+        assert len(await store.match("Tesla")) == 3
+
+    @pytest.mark.asyncio
+    async def test_remember_many_matches_sequential_remember(self):
+        r"""Bulk writes produce the same indexes as one-by-one writes."""
+        facts = [
+            fact("Tesla", "ceo", "Elon Musk"),
+            fact("Tesla", "hq", "Austin"),
+            fact("Dell", "hq", "Austin"),
+            fact("Tesla", "hq", "Palo Alto"),
+        ]
+        sequential = InMemoryFactStore()
+        for item in facts:
+            await sequential.remember(item)
+        bulk = InMemoryFactStore()
+        await bulk.remember_many(iter(facts))
+
+        assert await bulk.match() == await sequential.match()
+        assert await bulk.query_by_object("Austin") == await sequential.query_by_object("Austin")
+        assert (await bulk.get_single("Tesla", "hq")).object_value == "Palo Alto"
+
+    @pytest.mark.asyncio
+    async def test_results_are_copies(self):
+        r"""Mutating a result list does not touch the indexes."""
+        store = await seeded_store()
+
+        (await store.query("Tesla", "ceo")).clear()
+
+        assert len(await store.query("Tesla", "ceo")) == 1
+
+    @pytest.mark.asyncio
+    async def test_forget_predicate_updates_every_index(self):
+        r"""Forgetting one predicate removes it from SPO, POS and OSP."""
+        store = await seeded_store()
+
+        await store.forget("Tesla", "hq")
+
+        assert [f.predicate for f in await store.query("Tesla")] == ["ceo"]
+        assert [f.subject for f in await store.query_by_predicate("hq")] == ["Dell"]
+        assert [f.subject for f in await store.query_by_object("Austin")] == ["Dell"]
+
+    @pytest.mark.asyncio
+    async def test_forget_subject_removes_all_its_facts(self):
+        r"""Forgetting a subject drops every bucket it owned."""
+        store = await seeded_store()
+
+        await store.forget("Dell")
+        await store.forget("Unknown")
+
+        assert await store.query("Dell") == []
+        assert await store.query_by_object(["hardware"]) == []
+        assert [f.subject for f in await store.query_by_object("Austin")] == ["Tesla"]
+        assert len(store) == 3
+
+
+class CountingStore(InMemoryFactStore):
+    r"""In-memory store that counts backing `query` calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queries = 0
+
+    async def query(self, subject: str, predicate: Optional[str] = None) -> List[Fact]:
+        self.queries += 1
+        return await super().query(subject, predicate)
+
+
+async def cached_store(**kwargs) -> CachedFactStore:
+    backing = CountingStore()
+    await backing.remember_many([fact("Tesla", "ceo", "Elon Musk"), fact("Dell", "hq", "Austin")])
+    return CachedFactStore(backing, **kwargs)
+
+
+class TestCachedFactStore:
+    r"""Unit tests for the LRU query cache wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_queries_hit_the_cache(self):
+        r"""Only the first query for a key reaches the backing store."""
+        store = await cached_store()
+
+        first = await store.query("Tesla", "ceo")
+        first.clear()
+        second = await store.query("Tesla", "ceo")
+
+        assert [f.object_value for f in second] == ["Elon Musk"]
+        assert store.store.queries == 1
+        assert (await store.get_single("Tesla", "ceo")).object_value == "Elon Musk"
+        assert store.store.queries == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_the_touched_subject(self):
+        r"""remember/remember_many/forget drop cached queries for their subjects."""
+        store = await cached_store()
+        await store.query("Tesla", "ceo")
+        await store.query("Dell", "hq")
+
+        await store.remember(fact("Tesla", "ceo", "Someone else"))
+        assert [f.object_value for f in await store.query("Tesla", "ceo")] == ["Elon Musk", "Someone else"]
+        assert store.store.queries == 3
+
+        await store.query("Dell", "hq")
+        assert store.store.queries == 3
+
+        await store.remember_many([fact("Dell", "hq", "Round Rock")])
+        await store.forget("Tesla")
+        assert await store.query("Tesla", "ceo") == []
+        assert len(await store.query("Dell", "hq")) == 2
+        assert store.store.queries == 5
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_is_bounded(self):
+        r"""The least recently used key is evicted first."""
+        store = await cached_store(cache_entries=2)
+
+        await store.query("Tesla")
+        await store.query("Dell")
+        await store.query("Tesla")
+        await store.query("SpaceX")
+        await store.query("Tesla")
+        assert store.store.queries == 3
+
+        await store.query("Dell")
+        assert store.store.queries == 4
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self, monkeypatch):
+        r"""Cached results are refetched once `cache_expiration` elapses."""
+        clock = [100.0]
+        monkeypatch.setattr(graph.time, "monotonic", lambda: clock[0])
+        store = await cached_store(cache_expiration=10.0)
+
+        await store.query("Tesla")
+        clock[0] = 109.0
+        await store.query("Tesla")
+        assert store.store.queries == 1
+
+        clock[0] = 111.0
+        await store.query("Tesla")
+        assert store.store.queries == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_with_their_facts(self):
+        r"""A cached result is not served past the earliest fact expiry."""
+        store = await cached_store(cache_expiration=None)
+        past = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await store.remember(Fact(subject="Rates", predicate="fed", object_value=5.25, expires_at=past))
+
+        await store.query("Rates")
+        await store.query("Rates")
+
+        assert store.store.queries == 2
+
+    @pytest.mark.asyncio
+    async def test_match_routes_subject_queries_through_cache(self):
+        r"""Subject-bound patterns use the cache; others hit the backing indexes."""
+        store = await cached_store()
+
+        await store.match("Tesla")
+        await store.match("Tesla")
+        assert store.store.queries == 1
+        assert await store.match("Tesla", object_value=None) == []
+        assert store.store.queries == 1
+        assert [f.subject for f in await store.match(predicate="hq")] == ["Dell"]
+
+    def test_rejects_empty_cache(self):
+        r"""A cache must hold at least one entry."""
+        with pytest.raises(ValueError, match="cache_entries"):
+            CachedFactStore(InMemoryFactStore(), cache_entries=0)
@@ -0,0 +1,141 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from xrtm.forecast.core.memory import graph
+from xrtm.forecast.core.memory.graph import Fact, filter_fresh, parse_facts
+
+
+class TestParseFacts:
+    r"""Unit tests for batch fact validation."""
+
+    def test_validates_payloads_in_order(self):
+        r"""Dict payloads become `Fact` instances with defaults filled in."""
+        facts = parse_facts(
+            [
+                {"subject": "Tesla", "predicate": "ceo", "object_value": "Elon Musk"},
+                {"subject": "Tesla", "predicate": "hq", "object_value": "Austin", "confidence": 0.8},
+            ]
+        )
+
+        assert [fact.predicate for fact in facts] == ["ceo", "hq"]
+        assert facts[1].confidence == 0.8
+        assert facts[0].verified_at is not None
+
+    def test_accepts_generators_and_existing_facts(self):
+        r"""Any iterable works, and `Fact` instances pass through."""
+        existing = Fact(subject="A", predicate="p", object_value=1)
+        facts = parse_facts(payload for payload in [existing, {"subject": "B", "predicate": "p", "object_value": 2}])
+
+        assert facts[0] == existing
+        assert facts[1].subject == "B"
+
+    def test_rejects_invalid_payloads(self):
+        r"""Validation errors are reported for the offending entry."""
+        with pytest.raises(ValidationError):
+            parse_facts([{"subject": "A", "predicate": "p", "object_value": 1, "confidence": 2.0}])
+
+
+class TestFactKeys:
+    r"""Unit tests for fact key normalisation."""
+
+    def test_subject_and_predicate_are_shared(self):
+        r"""Equal keys built at runtime resolve to one shared string object."""
+        suffix = "".join(["202", "4"])
+        first = Fact(subject="Tesla", predicate="revenue_" + suffix, object_value=1)
+        second = Fact(subject="".join(["Tes", "la"]), predicate="revenue_" + suffix, object_value=2)
+
+        assert first.subject is second.subject
+        assert first.predicate is second.predicate
+        assert sys.intern("revenue_" + suffix) is first.predicate
+
+    def test_subjects_are_not_interned(self):
+        r"""Open-ended subjects go through the bounded table instead of `sys.intern`."""
+        subject = "".join(["Acme-", "7f3c"])
+        fact = Fact(subject=subject, predicate="p", object_value=1)
+
+        assert sys.intern("".join(["Acme-", "7f3c"])) is not fact.subject
+
+    def test_subject_table_is_bounded(self):
+        r"""The subject sharing table never grows past its fixed size."""
+        for i in range(graph._shared_subject.cache_info().maxsize + 10):
+            Fact(subject=f"entity-{i}", predicate="p", object_value=i)
+
+        info = graph._shared_subject.cache_info()
+        assert info.currsize == info.maxsize
+
+    def test_source_hashes_are_shared_without_interning(self):
+        r"""Facts citing the same evidence share one hash string; `None` stays `None`."""
+        digest = "".join(["ab"] * 32)
+        first = Fact(subject="A", predicate="p", object_value=1, source_hash=digest)
+        second = Fact(subject="B", predicate="p", object_value=2, source_hash="".join(["ab"] * 32))
+
+        assert first.source_hash is second.source_hash
+        assert sys.intern("".join(["ab"] * 32)) is not first.source_hash
+        assert Fact(subject="C", predicate="p", object_value=3).source_hash is None
+
+    def test_source_hash_table_is_bounded(self):
+        r"""The sharing table never grows past its fixed size."""
+        for i in range(graph._shared_source_hash.cache_info().maxsize + 10):
+            Fact(subject="A", predicate="p", object_value=i, source_hash=f"{i:064x}")
+
+        info = graph._shared_source_hash.cache_info()
+        assert info.currsize == info.maxsize
+
+    def test_batch_parsed_keys_are_shared(self):
+        r"""`parse_facts` goes through the same validator."""
+        facts = parse_facts(
+            {"subject": "".join(["S", str(i % 2)]), "predicate": "p", "object_value": i} for i in range(4)
+        )
+
+        assert facts[0].subject is facts[2].subject
+
+
+class TestFactStaleness:
+    r"""Unit tests for fact expiry checks."""
+
+    def test_is_stale_at_compares_against_expiry(self):
+        r"""A fact is stale strictly after its expiry."""
+        expires = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        item = Fact(subject="A", predicate="p", object_value=1, expires_at=expires)
+
+        assert item.is_stale_at(expires) is False
+        assert item.is_stale_at(expires + timedelta(seconds=1)) is True
+        assert Fact(subject="A", predicate="p", object_value=1).is_stale_at(expires) is False
+
+    def test_is_stale_uses_current_time(self):
+        r"""The property keeps its wall-clock behaviour."""
+        past = datetime.now(timezone.utc) - timedelta(days=1)
+        future = datetime.now(timezone.utc) + timedelta(days=1)
+
+        assert Fact(subject="A", predicate="p", object_value=1, expires_at=past).is_stale is True
+        assert Fact(subject="A", predicate="p", object_value=1, expires_at=future).is_stale is False
+
+    def test_filter_fresh_keeps_unexpired_facts_in_order(self):
+        r"""Expired facts are dropped against one shared reference time."""
+        now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        facts = [
+            Fact(subject="A", predicate="p", object_value=1, expires_at=now - timedelta(days=1)),
+            Fact(subject="B", predicate="p", object_value=2),
+            Fact(subject="C", predicate="p", object_value=3, expires_at=now),
+        ]
+
+        assert [fact.subject for fact in filter_fresh(facts, now=now)] == ["B", "C"]
+        assert [fact.subject for fact in filter_fresh(iter(facts))] == ["B"]
@@ -0,0 +1,57 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from xrtm.forecast.core.schemas.base import ConfidenceMetrics, EpisodicExperience, ReasoningSchema
+
+
+def build_experience(**overrides) -> EpisodicExperience:
+    values = {
+        "id": "exp-1",
+        "timestamp": "2024-01-01T00:00:00",
+        "subject_id": "subject",
+        "event_type": "forecast",
+        "input_snapshot": {},
+        "action_taken": "hold",
+    }
+    values.update(overrides)
+    return EpisodicExperience(**values)
+
+
+class TestEpisodicExperienceDefaults:
+    r"""Unit tests for the placeholder sub-models on `EpisodicExperience`."""
+
+    def test_defaults_match_validated_construction(self):
+        r"""Constructed placeholders dump identically to validated ones."""
+        experience = build_experience()
+
+        assert experience.confidence_metrics == ConfidenceMetrics()
+        assert experience.reasoning == ReasoningSchema(claim="N/A", evidence=[], risks=[], rationale="N/A")
+        assert experience.reasoning.causal_links == []
+
+    def test_defaults_are_not_shared(self):
+        r"""Each experience gets its own mutable placeholder lists."""
+        first = build_experience()
+        second = build_experience(id="exp-2")
+
+        first.reasoning.evidence.append("fact")
+
+        assert second.reasoning.evidence == []
+        assert first.confidence_metrics is not second.confidence_metrics
+
+    def test_explicit_metrics_are_still_validated(self):
+        r"""Only the defaults skip validation; caller payloads do not."""
+        experience = build_experience(confidence_metrics={"verbal_confidence": "0.7"})
+
+        assert experience.confidence_metrics.verbal_confidence == 0.7
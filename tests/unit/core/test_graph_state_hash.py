@@ -0,0 +1,45 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import hashlib
+
+from xrtm.forecast.core.schemas.graph import BaseGraphState
+
+
+class TestComputeHash:
+    r"""Unit tests for `BaseGraphState.compute_hash`."""
+
+    def test_default_is_sha256_and_ignores_volatile_fields(self):
+        r"""The default digest is SHA-256 hex and skips latencies/usage/hash fields."""
+        state = BaseGraphState(subject_id="q1", context={"k": "v"})
+        digest = state.compute_hash()
+
+        state.latencies["node"] = 1.5
+        state.state_hash = digest
+
+        assert len(digest) == 64
+        assert state.compute_hash() == digest
+
+    def test_pluggable_hasher(self):
+        r"""A custom hashlib constructor changes the algorithm but not determinism."""
+        state = BaseGraphState(subject_id="q1")
+        blake = functools.partial(hashlib.blake2b, digest_size=32)
+
+        digest = state.compute_hash(hasher=blake)
+
+        assert len(digest) == 64
+        assert digest != state.compute_hash()
+        assert digest == BaseGraphState(subject_id="q1").compute_hash(hasher=blake)
@@ -13,12 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
 
 from xrtm.forecast.core.orchestrator import Orchestrator
-from xrtm.forecast.core.schemas.graph import BaseGraphState
+from xrtm.forecast.core.schemas.graph import BaseGraphState, TemporalContext
 
 
 @pytest.mark.asyncio
@@ -89,3 +90,68 @@ async def test_orchestrator_none_node(caplog) -> None:
     state = BaseGraphState(subject_id="test_none")
     await orch.run(state)
     assert "Unknown node (function is None)" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_backtest_clock_is_scoped_to_node_execution() -> None:
+    r"""Nodes in a backtest see the frozen reference time; routing decisions run on the real clock."""
+    reference = datetime(2021, 3, 4, 5, 6)
+    seen: list[datetime] = []
+    routed_at: list[datetime] = []
+
+    async def record(s, p):
+        seen.append(datetime.now())
+        return None
+
+    def route(s):
+        routed_at.append(datetime.now())
+        return "ok"
+
+    orch = Orchestrator.create_standard(max_cycles=5)
+    for name in ("fetch", "analyze", "report"):
+        orch.add_node(name, record)
+    orch.add_edge("fetch", "analyze")
+    orch.add_conditional_edge("analyze", route, {"ok": "report"})
+    orch.set_entry_point("fetch")
+
+    state = BaseGraphState(
+        subject_id="chain", temporal_context=TemporalContext(reference_time=reference, is_backtest=True)
+    )
+    await orch.run(state)
+
+    assert state.execution_path == ["fetch", "analyze", "report"]
+    assert seen == [reference] * 3
+    assert routed_at[0] > reference
+    assert datetime.now() > reference
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_backtest_fuses_linear_chains_into_one_frozen_segment(monkeypatch) -> None:
+    r"""A linear chain enters the sandbox once; a conditional edge splits it into two segments."""
+    enters: list[str] = []
+
+    class CountingSandbox:
+        def __enter__(self):
+            enters.append("enter")
+
+        def __exit__(self, *exc_info):
+            enters.append("exit")
+
+    monkeypatch.setattr(Orchestrator, "_temporal_sandbox", staticmethod(lambda state: CountingSandbox()))
+
+    async def step(s, p):
+        return None
+
+    orch = Orchestrator.create_standard(max_cycles=10)
+    for name in ("fetch", "analyze", "trend", "report"):
+        orch.add_node(name, step)
+    orch.add_edge("fetch", "analyze")
+    orch.add_edge("analyze", "trend")
+    orch.add_conditional_edge("trend", lambda s: "ok", {"ok": "report"})
+    orch.set_entry_point("fetch")
+
+    state = BaseGraphState(subject_id="chain")
+    await orch.run(state)
+
+    assert state.execution_path == ["fetch", "analyze", "trend", "report"]
+    assert enters == ["enter", "exit", "enter", "exit"]
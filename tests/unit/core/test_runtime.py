@@ -13,11 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import time
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+from xrtm.forecast.core import runtime
 from xrtm.forecast.core.runtime import AsyncRuntime, temporal_context_var
 
 
@@ -47,6 +50,45 @@ class TestAsyncRuntime:
         name = await task
         assert "my_worker" in name
 
+    @pytest.mark.asyncio
+    async def test_gather_bounded_preserves_order_and_caps_concurrency(self):
+        """Verify bounded fan-out returns results in input order under the cap."""
+        in_flight = 0
+        peak = 0
+
+        async def worker(i):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (5 - i % 5))
+            in_flight -= 1
+            return i * i
+
+        results = await AsyncRuntime.gather_bounded((worker(i) for i in range(12)), max_workers=3)
+
+        assert results == [i * i for i in range(12)]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_failures(self):
+        """Verify errors propagate or are returned, and bad caps are rejected."""
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def ok():
+            return "ok"
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await AsyncRuntime.gather_bounded([ok(), fail()])
+
+        results = await AsyncRuntime.gather_bounded([ok(), fail()], return_exceptions=True)
+        assert results[0] == "ok"
+        assert isinstance(results[1], RuntimeError)
+
+        with pytest.raises(ValueError, match="max_workers"):
+            await AsyncRuntime.gather_bounded([], max_workers=0)
+
     @pytest.mark.asyncio
     async def test_sleep(self):
         """Verify sleep wrapper works (basic smoke test)."""
@@ -65,3 +107,52 @@ class TestAsyncRuntime:
             temporal_context_var.reset(token)
 
         assert time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_sleep_bypass_logs_lazily(self, caplog):
+        """Verify the backtest bypass still reports the skipped duration at DEBUG."""
+        token = temporal_context_var.set(SimpleNamespace(is_backtest=True))
+        try:
+            with caplog.at_level("DEBUG", logger=runtime.__name__):
+                await AsyncRuntime.sleep(2.5)
+        finally:
+            temporal_context_var.reset(token)
+
+        assert "Bypassing sleep of 2.5s" in caplog.text
+
+    def test_loop_factory_without_uvloop_is_none(self, monkeypatch):
+        """Verify the helper selects asyncio's default loop when uvloop is not installed."""
+        monkeypatch.setattr(runtime, "_UVLOOP_AVAILABLE", False)
+        assert AsyncRuntime.loop_factory() is None
+
+    def test_loop_factory_returns_uvloop_factory_without_installing_policy(self, monkeypatch):
+        """Verify the helper hands back uvloop.new_event_loop and leaves the global policy alone."""
+        fake_uvloop = MagicMock()
+        monkeypatch.setattr(runtime, "_UVLOOP_AVAILABLE", True)
+        monkeypatch.setattr(runtime, "uvloop", fake_uvloop, raising=False)
+
+        assert AsyncRuntime.loop_factory() is fake_uvloop.new_event_loop
+        fake_uvloop.install.assert_not_called()
+
+    def test_run_main_uses_uvloop_factory_without_installing_policy(self, monkeypatch):
+        """Verify run_main passes uvloop's loop factory to the runner."""
+        fake_uvloop = MagicMock()
+        fake_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+        monkeypatch.setattr(runtime, "_UVLOOP_AVAILABLE", True)
+        monkeypatch.setattr(runtime, "uvloop", fake_uvloop, raising=False)
+
+        async def main():
+            return "done"
+
+        assert AsyncRuntime.run_main(main()) == "done"
+        fake_uvloop.new_event_loop.assert_called_once_with()
+        fake_uvloop.install.assert_not_called()
+
+    def test_run_main_without_uvloop_uses_default_loop(self, monkeypatch):
+        """Verify run_main falls back to the standard event loop."""
+        monkeypatch.setattr(runtime, "_UVLOOP_AVAILABLE", False)
+
+        async def main():
+            return 42
+
+        assert AsyncRuntime.run_main(main()) == 42
@@ -0,0 +1,51 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from xrtm.forecast.core.config import main
+from xrtm.forecast.core.config.main import Settings, get_settings
+
+
+@pytest.fixture
+def fresh_settings():
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class TestGetSettings:
+    r"""Unit tests for the lazily built settings singleton."""
+
+    def test_returns_one_shared_instance(self, fresh_settings):
+        r"""Repeated calls reuse the first instance."""
+        first = get_settings()
+        assert isinstance(first, Settings)
+        assert get_settings() is first
+
+    def test_module_attribute_resolves_to_singleton(self, fresh_settings):
+        r"""`main.settings` stays importable and is the cached instance."""
+        assert main.settings is get_settings()
+        assert "settings" not in vars(main)
+
+    def test_construction_is_deferred_until_first_access(self, fresh_settings, monkeypatch):
+        r"""Environment changes made before first access are picked up."""
+        monkeypatch.setenv("FORECAST_DEFAULT_TIMEOUT", "45")
+        assert get_settings().default_timeout == 45
+
+    def test_unknown_attribute_raises(self):
+        r"""Only `settings` is served lazily."""
+        with pytest.raises(AttributeError):
+            main.not_a_setting  # noqa: B018
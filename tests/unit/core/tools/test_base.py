@@ -112,6 +112,23 @@ class TestFunctionTool:
         assert "required_param" in schema["required"]
         assert "optional_param" not in schema["required"]
 
+    def test_parameters_schema_not_shared_between_tools(self):
+        r"""Should give each tool its own schema even when the signature walk is memoized."""
+
+        def search(query: str, limit: int = 5):
+            pass
+
+        first = FunctionTool(search, name="search_a")
+        first.parameters_schema["properties"]["limit"]["type"] = "string"
+        first.parameters_schema["required"].append("limit")
+        second = FunctionTool(search, name="search_b")
+
+        assert second.parameters_schema == {
+            "type": "object",
+            "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+            "required": ["query"],
+        }
+
 
 class TestStrandToolWrapper:
     r"""Tests for the StrandToolWrapper class."""
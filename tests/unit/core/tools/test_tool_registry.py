@@ -0,0 +1,63 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Unit tests for forecast.core.tools.registry."""
+
+from xrtm.forecast.core.tools.registry import ToolRegistry
+
+
+def alpha(x: int) -> int:
+    return x
+
+
+def beta(x: int) -> int:
+    return -x
+
+
+class TestToolRegistry:
+    r"""Tests for the ToolRegistry lookup helpers."""
+
+    def test_all_tools_reused_until_next_registration(self):
+        r"""Should return the same snapshot until a new tool is registered."""
+        registry = ToolRegistry()
+        registry.register_fn(alpha)
+
+        first = registry.all_tools()
+        assert registry.all_tools() is first
+        assert [t.name for t in first] == ["alpha"]
+
+        registry.register_fn(beta)
+        assert [t.name for t in registry.all_tools()] == ["alpha", "beta"]
+        assert [t.name for t in first] == ["alpha"]
+
+    def test_list_tools_returns_independent_copy(self):
+        r"""Should hand out a fresh list so callers cannot mutate the snapshot."""
+        registry = ToolRegistry()
+        registry.register_fn(alpha)
+
+        names = registry.list_tools()
+        names.append("bogus")
+
+        assert registry.list_tools() == ["alpha"]
+
+    def test_get_many_preserves_order_and_skips_unknown(self):
+        r"""Should return known tools in request order and drop missing names."""
+        registry = ToolRegistry()
+        registry.register_fn(alpha)
+        registry.register_fn(beta)
+
+        tools = registry.get_many(["beta", "missing", "alpha"])
+
+        assert [t.name for t in tools] == ["beta", "alpha"]
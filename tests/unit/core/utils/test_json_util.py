@@ -15,6 +15,9 @@
 
 r"""Unit tests for forecast.core.utils.json_util."""
 
+from collections import OrderedDict
+from enum import Enum
+
 from pydantic import BaseModel
 
 from xrtm.forecast.core.utils.json_util import robust_clean, safe_json_dumps
@@ -81,6 +84,16 @@ class TestRobustClean:
         result = robust_clean(CustomObject())
         assert result == "custom_repr"
 
+    def test_subclasses_take_general_path(self):
+        r"""Subclasses of leaf and container types should clean like their bases."""
+
+        class Color(str, Enum):
+            RED = "red"
+
+        result = robust_clean(OrderedDict(color=Color.RED, _hidden=1, ratio=float("nan")))
+        assert result == {"color": "red", "ratio": None}
+        assert robust_clean(Color.RED) is Color.RED
+
 
 class TestSafeJsonDumps:
     r"""Tests for the safe_json_dumps function."""
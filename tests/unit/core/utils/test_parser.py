@@ -15,6 +15,9 @@
 
 r"""Unit tests for forecast.core.utils.parser."""
 
+import pytest
+
+from xrtm.forecast.core.utils import parser
 from xrtm.forecast.core.utils.parser import parse_json_markdown
 
 
@@ -111,3 +114,40 @@ No actual JSON here either
         text = "[]"
         result = parse_json_markdown(text)
         assert result == []
+
+    def test_json_followed_by_unrelated_braces(self):
+        r"""Should stop at the balanced close instead of the last brace in the text."""
+        text = '{"probability": 0.6} -- note: {see appendix}'
+        result = parse_json_markdown(text)
+        assert result == {"probability": 0.6}
+
+    def test_braces_inside_string_values(self):
+        r"""Should ignore brackets and escaped quotes inside JSON strings."""
+        text = 'Answer: {"reasoning": "set {a, b] is \\"odd\\"", "ok": true} done'
+        result = parse_json_markdown(text)
+        assert result == {"reasoning": 'set {a, b] is "odd"', "ok": True}
+
+    def test_skips_non_json_bracketed_prose(self):
+        r"""Should move past bracketed prose to the first span that parses."""
+        text = 'Use {curly} braces like so: {"value": 3}'
+        result = parse_json_markdown(text)
+        assert result == {"value": 3}
+
+
+class TestJsonDecoding:
+    r"""Tests for the optional orjson decoding path."""
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_decoders_agree(self, monkeypatch, orjson_available):
+        r"""Should parse identically with and without orjson."""
+        if orjson_available and not parser._ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(parser, "_ORJSON_AVAILABLE", orjson_available)
+        text = 'Result: ```json\n{"p": 0.25, "tags": ["a", "\\u00e9"], "ok": null}\n```'
+        assert parse_json_markdown(text) == {"p": 0.25, "tags": ["a", "\u00e9"], "ok": None}
+
+    def test_stdlib_only_inputs_still_parse(self):
+        r"""Should fall back to the stdlib decoder for inputs orjson rejects."""
+        result = parse_json_markdown('{"value": NaN, "big": 123456789012345678901234567890}')
+        assert result["value"] != result["value"]
+        assert result["big"] == 123456789012345678901234567890
@@ -18,7 +18,7 @@ r"""Unit tests for forecast.core.utils.state_ops."""
 from typing import Any, Dict, List
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from xrtm.forecast.core.utils.state_ops import clone_state
 
@@ -38,6 +38,16 @@ class NestedState(BaseModel):
     items: List[Dict[str, int]] = []
 
 
+class RichState(BaseModel):
+    r"""State with extras and a private attribute."""
+
+    model_config = ConfigDict(extra="allow")
+
+    history: List[str] = []
+    latest: List[str] = []
+    _scratch: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+
 class TestCloneState:
     r"""Tests for the clone_state function."""
 
@@ -108,3 +118,46 @@ class TestCloneState:
 
         assert cloned.name == "test"
         assert cloned.value == 42
+
+    def test_preserves_aliasing_across_fields(self):
+        r"""Should keep one shared object shared inside the clone, like a full deep copy."""
+        original = RichState(history=["a"])
+        original.latest = original.history
+        cloned = clone_state(original)
+
+        assert cloned.history is cloned.latest
+        assert cloned.history is not original.history
+
+    def test_copies_extras_and_private_attributes(self):
+        r"""Should isolate extra fields and private attributes as well."""
+        original = RichState(notes=["x"])
+        original._scratch["hits"] = 1
+        cloned = clone_state(original)
+
+        cloned.notes.append("y")
+        cloned._scratch["hits"] = 2
+
+        assert original.notes == ["x"]
+        assert original._scratch == {"hits": 1}
+
+    def test_fields_set_tracks_overrides(self):
+        r"""Should keep the original fields_set and add overridden fields."""
+        original = SimpleState(name="test", value=1)
+        cloned = clone_state(original, overrides={"tags": ["z"]})
+
+        assert cloned.model_fields_set == {"name", "value", "tags"}
+        assert original.model_fields_set == {"name", "value"}
+
+    def test_overridden_values_are_used_as_given(self):
+        r"""Should install override values without copying the field they replace."""
+        replacement = {"fresh": 1}
+        cloned = clone_state(NestedState(data={"old": 1}), overrides={"data": replacement})
+
+        assert cloned.data is replacement
+
+    def test_reports_first_unknown_key_in_override_order(self):
+        r"""Should name the first unknown key as given by the caller."""
+        original = SimpleState(name="test", value=1)
+
+        with pytest.raises(ValueError, match="'zeta'"):
+            clone_state(original, overrides={"name": "ok", "zeta": 1, "alpha": 2})
@@ -0,0 +1,164 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Unit tests for forecast.kit.agents.base."""
+
+import json
+from typing import Any, Optional
+
+import pytest
+
+from xrtm.forecast.kit.agents.base import Agent, _init_accepts_model
+from xrtm.forecast.version import __version__
+
+
+class PlainAgent(Agent):
+    r"""Agent whose constructor takes no model."""
+
+    async def run(self, input_data: Any, **kwargs: Any) -> Any:
+        return input_data
+
+
+class ModelAgent(Agent):
+    r"""Agent whose constructor accepts a model."""
+
+    def __init__(self, model: Any, name: Optional[str] = None):
+        super().__init__(name)
+        self.model = model
+
+    async def run(self, input_data: Any, **kwargs: Any) -> Any:
+        return input_data
+
+
+class TestFromConfig:
+    r"""Tests for the Agent.from_config factory."""
+
+    def test_injects_model_when_constructor_accepts_it(self):
+        r"""Should pass the model through to constructors that declare it."""
+        model = object()
+        agent = ModelAgent.from_config(model=model, name="with_model")
+        assert isinstance(agent, ModelAgent)
+        assert agent.model is model
+        assert agent.name == "with_model"
+
+    def test_skips_model_when_constructor_does_not_accept_it(self):
+        r"""Should construct without a model for constructors that do not declare it."""
+        agent = PlainAgent.from_config(model=object(), name="plain")
+        assert isinstance(agent, PlainAgent)
+        assert agent.name == "plain"
+
+    def test_signature_probe_is_cached_per_class(self):
+        r"""Should inspect each class constructor only once."""
+        _init_accepts_model.cache_clear()
+        ModelAgent.from_config(model=object())
+        ModelAgent.from_config(model=object())
+        PlainAgent.from_config(model=object())
+        info = _init_accepts_model.cache_info()
+        assert info.misses == 2
+        assert info.hits == 1
+
+
+class TestGetInfo:
+    r"""Tests for Agent.get_info."""
+
+    def test_info_is_a_fresh_json_serializable_dict(self):
+        r"""Should return a plain dict that callers can modify and serialize."""
+        agent = PlainAgent(name="tracer")
+        info = agent.get_info()
+
+        assert info == {"name": "tracer", "type": "PlainAgent", "version": __version__}
+        assert json.loads(json.dumps(info)) == info
+        info["name"] = "other"
+        assert agent.get_info()["name"] == "tracer"
+
+    def test_info_tracks_renamed_agent(self):
+        r"""Should reflect the agent's current name."""
+        agent = PlainAgent(name="before")
+        agent.get_info()
+        agent.name = "after"
+        assert agent.get_info()["name"] == "after"
+
+
+class TestModelId:
+    r"""Tests for LLMAgent.model_id."""
+
+    def test_model_id_tracks_model_assignment(self):
+        r"""Should expose the provider's model_id and refresh it when the model changes."""
+        from types import SimpleNamespace
+
+        from xrtm.forecast.kit.agents.llm import LLMAgent
+
+        agent = LLMAgent(model=SimpleNamespace(model_id="gpt-4o-mini"))
+        assert agent.model_id == "gpt-4o-mini"
+
+        agent.model = SimpleNamespace(model_id="llama-3")
+        assert agent.model_id == "llama-3"
+        assert agent.model.model_id == "llama-3"
+
+    def test_model_id_defaults_to_unknown(self):
+        r"""Should fall back to 'unknown' for providers without a model_id."""
+        from xrtm.forecast.kit.agents.llm import LLMAgent
+
+        assert LLMAgent(model=object()).model_id == "unknown"
+
+    def test_patched_model_is_restored(self):
+        r"""Should let `mock.patch.object` swap the model and put the original back."""
+        from types import SimpleNamespace
+        from unittest import mock
+
+        from xrtm.forecast.kit.agents.llm import LLMAgent
+
+        original = SimpleNamespace(model_id="gpt-4o-mini")
+        agent = LLMAgent(model=original)
+        with mock.patch.object(agent, "model", SimpleNamespace(model_id="stub")):
+            assert agent.model_id == "stub"
+        assert agent.model is original
+        assert agent.model_id == "gpt-4o-mini"
+
+        del agent.model
+        assert not hasattr(agent, "model")
+        assert not hasattr(agent, "model_id")
+
+
+class TestPatching:
+    r"""Tests that built-in agents stay open to patching."""
+
+    @pytest.mark.asyncio
+    async def test_built_in_agents_stay_patchable(self):
+        r"""Should allow patching, ad-hoc attributes and weak references."""
+        import weakref
+        from unittest import mock
+
+        from xrtm.forecast.core.orchestrator import Orchestrator
+        from xrtm.forecast.kit.agents.graph import GraphAgent
+        from xrtm.forecast.kit.agents.llm import LLMAgent
+        from xrtm.forecast.kit.agents.routing import RoutingAgent
+        from xrtm.forecast.kit.agents.specialists.analyst import ForecastingAnalyst
+        from xrtm.forecast.kit.agents.tool import ToolAgent
+
+        agents = (
+            LLMAgent(model=object()),
+            GraphAgent(Orchestrator()),
+            RoutingAgent(router_model=object(), fast_tier=PlainAgent()),
+            ToolAgent(len),
+            ForecastingAnalyst(model=object()),
+        )
+        for agent in agents:
+            assert weakref.ref(agent)() is agent
+
+            agent.extra = "allowed"
+            assert agent.extra == "allowed"
+            with mock.patch.object(agent, "run", mock.AsyncMock(return_value="patched")):
+                assert await agent.run("input") == "patched"
@@ -0,0 +1,57 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Unit tests for forecast.kit.agents.registry."""
+
+import sys
+from typing import Any
+
+from xrtm.forecast.kit.agents.base import Agent
+from xrtm.forecast.kit.agents.registry import AgentRegistry
+
+
+class EchoAgent(Agent):
+    async def run(self, input_data: Any, **kwargs: Any) -> Any:
+        return input_data
+
+
+class TestAgentRegistry:
+    r"""Tests for AgentRegistry name handling."""
+
+    def test_lookup_is_case_insensitive(self):
+        r"""Should resolve an agent regardless of the casing used to query it."""
+        registry = AgentRegistry()
+        agent = EchoAgent(name="ExpertAnalyst")
+        registry.register(agent)
+
+        assert registry.get_agent("expertanalyst") is agent
+        assert registry.get_agent("EXPERTANALYST") is agent
+        assert registry.get_specialist("ExpertAnalyst") is agent
+        assert registry.list_agents() == ["expertanalyst"]
+
+    def test_unknown_name_returns_none(self):
+        r"""Should return None for names that were never registered."""
+        assert AgentRegistry().get_agent("Missing") is None
+
+    def test_only_registered_keys_are_interned(self):
+        r"""Should intern keys on registration but not for names that are only looked up."""
+        registry = AgentRegistry()
+        registry.register(EchoAgent(name="".join(["Expert", "Analyst"])))
+
+        (key,) = registry.list_agents()
+        assert sys.intern("".join(["expert", "analyst"])) is key
+        missing = "".join(["never-", "registered-7c1e"])
+        assert registry.get_agent(missing) is None
+        assert sys.intern(missing) is missing
@@ -13,11 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 import logging
+from datetime import datetime, timezone
 
 import pytest
 
+from xrtm.forecast.core.runtime import temporal_context_var
+from xrtm.forecast.core.schemas.forecast import ForecastQuestion
+from xrtm.forecast.core.schemas.graph import TemporalContext
 from xrtm.forecast.kit.agents.specialists.analyst import ForecastingAnalyst
 from xrtm.forecast.providers.inference.base import InferenceProvider, ModelResponse
 
@@ -71,6 +76,33 @@ class ExplicitIntervalProvider(InferenceProvider):
         yield self.generate_content("")
 
 
+class RecordingProvider(ExplicitIntervalProvider):
+    r"""Provider that records every prompt it receives."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt: str, output_logprobs: bool = False, **kwargs):
+        self.prompts.append(prompt)
+        return super().generate_content(prompt, output_logprobs, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_prompt_embeds_title_and_context():
+    r"""The prompt should carry the question title, context, and the output schema."""
+
+    provider = RecordingProvider()
+    agent = ForecastingAnalyst(model=provider)
+
+    await agent.run(ForecastQuestion(id="q1", title="Will it rain?", description="Forecast for Lisbon."))
+
+    (prompt,) = provider.prompts
+    assert prompt.startswith("Analyze the following event and provide a probabilistic forecast")
+    assert "\nTitle: Will it rain?\nContext: Forecast for Lisbon.\n\n" in prompt
+    assert "- confidence_interval: {'low': float, 'high': float, 'level': 0.9}\n" in prompt
+    assert prompt.endswith("representing your reasoning.")
+
+
 @pytest.mark.asyncio
 async def test_forecasting_analyst_backfills_missing_confidence_interval(caplog):
     r"""Legacy provider-free payloads should not trigger schema validation warnings."""
@@ -96,3 +128,195 @@ async def test_forecasting_analyst_preserves_explicit_confidence_interval():
 
     assert result.confidence_interval is not None
     assert result.confidence_interval.model_dump() == {"low": 0.5, "high": 0.7, "level": 0.8}
+
+
+class SlowProvider(ExplicitIntervalProvider):
+    r"""Provider that tracks how many requests are in flight at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def generate_content_async(self, prompt: str, output_logprobs: bool = False, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return self.generate_content(prompt, output_logprobs, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_run_many_bounds_concurrency():
+    r"""Batch runs should keep input order and never exceed the concurrency limit."""
+
+    provider = SlowProvider()
+    agent = ForecastingAnalyst(model=provider)
+    questions = [ForecastQuestion(id=f"q{i}", title=f"Question {i}?") for i in range(7)]
+
+    results = await agent.run_many(questions, concurrency=3)
+
+    assert [r.question_id for r in results] == [q.id for q in questions]
+    assert provider.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_run_many_rejects_zero_concurrency():
+    r"""A non-positive concurrency limit is a caller error."""
+
+    with pytest.raises(ValueError, match="concurrency"):
+        await ForecastingAnalyst(model=ExplicitIntervalProvider()).run_many(["Q?"], concurrency=0)
+
+
+class CountingProvider(ExplicitIntervalProvider):
+    r"""Provider that counts how many forecasts it produced."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content_async(self, prompt: str, output_logprobs: bool = False, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.generate_content(prompt, output_logprobs, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_output_cache_reuses_identical_questions():
+    r"""With caching enabled, identical questions should reach the provider only once."""
+
+    provider = CountingProvider()
+    agent = ForecastingAnalyst(model=provider, output_cache_size=4)
+    question = ForecastQuestion(id="q1", title="Will it rain?", description="Lisbon.")
+
+    first, second = await asyncio.gather(agent.run(question), agent.run(question))
+    third = await agent.run(ForecastQuestion(id="q1", title="Will it rain?", description="Lisbon."))
+    await agent.run(ForecastQuestion(id="q1", title="Will it rain?", description="Porto."))
+
+    assert provider.calls == 2
+    assert first.probability == second.probability == third.probability
+    assert first is not second
+
+    first.reasoning = "mutated"
+    assert (await agent.run(question)).reasoning == "Structured payload."
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_output_cache_is_scoped_to_reference_time():
+    r"""A backtest sweeping reference dates must not reuse forecasts made at another cutoff."""
+
+    provider = CountingProvider()
+    agent = ForecastingAnalyst(model=provider, output_cache_size=4)
+    question = ForecastQuestion(id="q1", title="Will it rain?", description="Lisbon.")
+
+    for reference_time in [datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 6, 1, tzinfo=timezone.utc)]:
+        token = temporal_context_var.set(TemporalContext(reference_time=reference_time, is_backtest=True))
+        try:
+            await agent.run(question)
+            await agent.run(question)
+        finally:
+            temporal_context_var.reset(token)
+
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_output_cache_is_disabled_by_default():
+    r"""Without an explicit cache size, every run should reach the provider."""
+
+    provider = CountingProvider()
+    agent = ForecastingAnalyst(model=provider)
+
+    await agent.run("Will it rain?")
+    await agent.run("Will it rain?")
+
+    assert provider.calls == 2
+
+
+class RecordingSearchSkill:
+    r"""Stand-in web_search skill that records its queries."""
+
+    name = "web_search"
+    description = "Records queries."
+
+    def __init__(self):
+        self.queries = []
+
+    async def execute(self, query: str):
+        self.queries.append(query)
+        return "Fresh findings."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "description, searched",
+    [
+        ("Short context.", True),
+        (None, True),
+        ("x" * ForecastingAnalyst.SEARCH_CONTEXT_THRESHOLD, False),
+        ("See https://example.org/report for details.", False),
+    ],
+)
+async def test_forecasting_analyst_skips_search_when_context_suffices(description, searched):
+    r"""web_search should only run for questions with thin, unsourced context."""
+
+    provider = RecordingProvider()
+    skill = RecordingSearchSkill()
+    agent = ForecastingAnalyst(model=provider)
+    agent.add_skill(skill)
+
+    await agent.run(ForecastQuestion(id="q1", title="Will it rain?", description=description))
+
+    assert skill.queries == (["Will it rain?"] if searched else [])
+    assert ("Search Findings:" in provider.prompts[0]) is searched
+
+
+class StaticProvider(ExplicitIntervalProvider):
+    r"""Provider that returns a fixed raw completion."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def generate_content(self, prompt: str, output_logprobs: bool = False, **kwargs):
+        return ModelResponse(text=self.text)
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_keeps_fields_from_schema_invalid_payloads():
+    r"""Payloads that fail AnalystOutput validation should still contribute the fields they carry."""
+
+    payload = {"probability": 0.7, "causal_nodes": [{"node_id": "n1", "event": "Rain"}]}
+    agent = ForecastingAnalyst(model=StaticProvider(json.dumps(payload)))
+
+    result = await agent.run("Will it rain?")
+
+    assert result.probability == pytest.approx(0.7)
+    assert result.reasoning == "Parsing failed fallback."
+    assert result.confidence_interval.model_dump() == {"low": 0.6, "high": 0.8, "level": 0.9}
+    assert [n.node_id for n in result.logical_trace] == ["n1"]
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_defaults_on_unparseable_output():
+    r"""Non-JSON completions should yield a neutral forecast."""
+
+    agent = ForecastingAnalyst(model=StaticProvider("I cannot answer that."))
+
+    result = await agent.run("Will it rain?")
+
+    assert result.probability == pytest.approx(0.5)
+    assert result.reasoning.startswith("Parsing failed")
+    assert result.logical_trace == []
+
+
+@pytest.mark.asyncio
+async def test_forecasting_analyst_parses_fenced_json_replies():
+    r"""Replies wrapped in prose and markdown fences should still be parsed."""
+
+    payload = {"probability": 0.42, "reasoning": "Fenced.", "causal_nodes": [{"node_id": "n1", "event": "E"}]}
+    text = "Here is my forecast:\n```json\n" + json.dumps(payload) + "\n```"
+    agent = ForecastingAnalyst(model=StaticProvider(text))
+
+    result = await agent.run("Will it rain?")
+
+    assert result.probability == pytest.approx(0.42)
+    assert result.reasoning == "Fenced."
+    assert [n.node_id for n in result.logical_trace] == ["n1"]
@@ -0,0 +1,102 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Unit tests for forecast.kit.agents.graph."""
+
+import asyncio
+
+import pytest
+
+from xrtm.forecast.core.orchestrator import Orchestrator
+from xrtm.forecast.kit.agents.graph import GraphAgent
+
+
+async def echo_node(state, on_progress=None):
+    state.context["echo"] = state.context["input"]
+    return None
+
+
+def build_agent() -> GraphAgent:
+    orchestrator = Orchestrator()
+    orchestrator.add_node("echo", echo_node)
+    orchestrator.set_entry_point("echo")
+    return GraphAgent(orchestrator, name="Echo")
+
+
+class TestGraphAgentRun:
+    r"""Tests for GraphAgent.run."""
+
+    @pytest.mark.asyncio
+    async def test_run_seeds_context_with_input_and_kwargs(self):
+        r"""Should expose the input and extra kwargs to the sub-graph context."""
+        result = await build_agent().run("hello", locale="en")
+
+        assert result["input"] == "hello"
+        assert result["locale"] == "en"
+        assert result["echo"] == "hello"
+
+    @pytest.mark.asyncio
+    async def test_repeated_runs_return_independent_contexts(self):
+        r"""Should not share or recycle state between runs of the same agent."""
+        agent = build_agent()
+
+        first = await agent.run("a")
+        second = await agent.run("b")
+
+        assert first is not second
+        assert first["echo"] == "a"
+        assert second["echo"] == "b"
+
+    @pytest.mark.asyncio
+    async def test_run_many_preserves_input_order(self):
+        r"""Should run each input through its own sub-graph and keep result order."""
+        results = await build_agent().run_many(["a", "b", "c"], locale="en")
+
+        assert [r["echo"] for r in results] == ["a", "b", "c"]
+        assert all(r["locale"] == "en" for r in results)
+        assert len({id(r) for r in results}) == 3
+
+    @pytest.mark.asyncio
+    async def test_run_many_with_no_inputs_returns_empty_list(self):
+        r"""Should return an empty list without running the sub-graph."""
+        assert await build_agent().run_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_run_many_bounds_concurrency(self):
+        r"""Should keep at most `concurrency` sub-graph runs in flight."""
+        active = peak = 0
+
+        async def slow_node(state, on_progress=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            state.context["echo"] = state.context["input"]
+
+        orchestrator = Orchestrator()
+        orchestrator.add_node("slow", slow_node)
+        orchestrator.set_entry_point("slow")
+
+        results = await GraphAgent(orchestrator).run_many(range(6), concurrency=2)
+
+        assert [r["echo"] for r in results] == list(range(6))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_run_many_rejects_zero_concurrency(self):
+        r"""Should refuse a concurrency below one."""
+        with pytest.raises(ValueError, match="concurrency"):
+            await build_agent().run_many(["a"], concurrency=0)
@@ -0,0 +1,311 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Unit tests for forecast.kit.agents.routing."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from xrtm.forecast.kit.agents.base import Agent
+from xrtm.forecast.kit.agents.routing import RoutingAgent, _fast_classify, _parse_decision, _truncated_str
+from xrtm.forecast.providers.inference.base import ModelResponse
+
+
+class TierAgent(Agent):
+    async def run(self, input_data: Any, **kwargs: Any) -> Any:
+        return self.name
+
+
+def build_router(router_text: str = "FAST") -> RoutingAgent:
+    router_model = MagicMock()
+    router_model.run = AsyncMock(return_value=ModelResponse(text=router_text))
+    return RoutingAgent(router_model=router_model, fast_tier=TierAgent("fast"), smart_tier=TierAgent("smart"))
+
+
+class TestFastClassify:
+    r"""Tests for the keyword pre-classifier."""
+
+    @pytest.mark.parametrize(
+        "task",
+        ["List the G7 member states.", "What is the capital of Chile?", "Format this date as ISO 8601."],
+    )
+    def test_short_lookup_tasks_are_fast(self, task):
+        r"""Should classify short lookup and formatting tasks as FAST."""
+        assert _fast_classify(task) == "FAST"
+
+    @pytest.mark.parametrize(
+        "task",
+        ["Analyze the drivers of inflation.", "Explain why the treaty failed.", "List and synthesize the evidence."],
+    )
+    def test_reasoning_tasks_are_smart(self, task):
+        r"""Should classify reasoning tasks as SMART even if they also contain FAST keywords."""
+        assert _fast_classify(task) == "SMART"
+
+    def test_inconclusive_tasks_defer_to_router(self):
+        r"""Should return None for tasks without decisive keywords or long FAST-looking tasks."""
+        assert _fast_classify("simple task") is None
+        assert _fast_classify("Where is " + "x" * 300) is None
+        assert _fast_classify("Checklist review") is None
+
+
+class TestParseDecision:
+    r"""Tests for router reply normalization."""
+
+    @pytest.mark.parametrize(
+        "reply, expected",
+        [
+            ("SMART", "SMART"),
+            (" fast\n", "FAST"),
+            ("Smart.", "SMART"),
+            ("I would classify this task as: SMART", "SMART"),
+            ("'FAST' or 'SMART'? FAST.", "FAST"),
+            ("SMART, not FAST", "SMART"),
+            ("unclear", "FAST"),
+            ("x" * 100 + "SMART", "FAST"),
+        ],
+    )
+    def test_earliest_label_in_head_wins(self, reply, expected):
+        r"""Should pick the first label within the scanned head of the reply."""
+        assert _parse_decision(reply) == expected
+
+
+class Ticket(BaseModel):
+    title: str
+    content: str
+
+
+class TestTruncatedStr:
+    r"""Tests for the bounded task preview used by the router."""
+
+    def test_strings_are_sliced(self):
+        r"""Should slice strings to the limit."""
+        assert _truncated_str("abcdef", limit=3) == "abc"
+
+    def test_models_render_fields_within_budget(self):
+        r"""Should render model fields as key=value and stop at the limit."""
+        ticket = Ticket(title="Rates", content="x" * 10_000)
+
+        preview = _truncated_str(ticket, limit=40)
+
+        assert preview.startswith("title=Rates content=xxx")
+        assert len(preview) == 40
+
+    def test_mappings_stop_once_budget_is_spent(self):
+        r"""Should not render entries past the budget."""
+        payload = {"a": "1" * 50, "b": "2" * 50}
+
+        assert _truncated_str(payload, limit=20) == "a=" + "1" * 18
+
+    def test_other_objects_fall_back_to_str(self):
+        r"""Should fall back to str() for other types."""
+        assert _truncated_str([1, 2, 3], limit=5) == "[1, 2"
+
+
+class TestRoutingAgentHeuristics:
+    r"""Tests for RoutingAgent's use of the pre-classifier."""
+
+    @pytest.mark.asyncio
+    async def test_obvious_task_skips_router_model(self):
+        r"""Should route without calling the router model when heuristics decide."""
+        router = build_router(router_text="SMART")
+
+        assert await router.run("What is the capital of Chile?") == "fast"
+        router.router_model.run.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_task_uses_router_model(self):
+        r"""Should fall back to the router model for inconclusive tasks."""
+        router = build_router(router_text="SMART")
+
+        assert await router.run("Handle the quarterly report") == "smart"
+        router.router_model.run.assert_awaited_once()
+
+        prompt = router.router_model.run.await_args.args[0]
+        assert prompt.startswith("Classify the following task complexity as 'FAST' or 'SMART'.\n")
+        assert prompt.endswith("Task: Handle the quarterly report\n\nResponse: [FAST/SMART]")
+
+    @pytest.mark.asyncio
+    async def test_tiers_receive_untruncated_input(self):
+        r"""Should only truncate the classification preview, not the routed payload."""
+        router = build_router(router_text="FAST")
+        router.routes["fast"] = MagicMock(run=AsyncMock(return_value="done"), spec=["run"])
+        payload = {"document": "y" * 5_000}
+
+        assert await router.run(payload) == "done"
+        router.routes["fast"].run.assert_awaited_once_with(payload)
+        prompt = router.router_model.run.await_args.args[0]
+        assert "Task: document=" + "y" * 791 + "\n" in prompt
+
+    @pytest.mark.asyncio
+    async def test_heuristics_can_be_disabled(self):
+        r"""Should always consult the router model when use_heuristics is False."""
+        router = build_router(router_text="SMART")
+        router.use_heuristics = False
+
+        assert await router.run("What is the capital of Chile?") == "smart"
+        router.router_model.run.assert_awaited_once()
+
+
+class TestRoutingAgentDecisionCache:
+    r"""Tests for the router-model decision cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_task_reuses_router_decision(self):
+        r"""Should call the router model once for identical ambiguous tasks."""
+        router = build_router(router_text="SMART")
+
+        assert await router.run("Handle the quarterly report") == "smart"
+        assert await router.run("Handle the quarterly report") == "smart"
+        router.router_model.run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        r"""Should keep at most decision_cache_size entries, evicting the oldest."""
+        router = build_router(router_text="FAST")
+        router._cache_max = 2
+
+        for task in ("task one", "task two", "task one", "task three"):
+            await router.run(task)
+        assert router.router_model.run.await_count == 3
+
+        await router.run("task two")
+        assert router.router_model.run.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_router_calls_are_not_cached(self):
+        r"""Should not remember the SMART fallback used when the router model fails."""
+        router = build_router()
+        router.router_model.run = AsyncMock(side_effect=[RuntimeError("down"), ModelResponse(text="FAST")])
+
+        assert await router.run("Handle the quarterly report") == "smart"
+        assert await router.run("Handle the quarterly report") == "fast"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_tasks_share_one_router_call(self):
+        r"""Should coalesce concurrent classifications of the same task into one router call."""
+        router = build_router(router_text="SMART")
+        router._cache_max = 0
+
+        results = await asyncio.gather(*(router.run("Handle the quarterly report") for _ in range(5)))
+
+        assert results == ["smart"] * 5
+        router.router_model.run.assert_awaited_once()
+        assert router._inflight == {}
+
+
+class TestRoutingAgentBatching:
+    r"""Tests for batching distinct concurrent classifications into one router call."""
+
+    @pytest.mark.asyncio
+    async def test_distinct_concurrent_tasks_share_one_router_call(self):
+        r"""Should number each task in one prompt and route by the per-task labels."""
+        router = build_router(router_text="Task 1: SMART\nTask 2: FAST\nTask 3: SMART")
+        tasks = ["Handle the quarterly report", "Handle the churn numbers", "Handle the board memo"]
+
+        results = await asyncio.gather(*(router.run(task) for task in tasks))
+
+        assert results == ["smart", "fast", "smart"]
+        router.router_model.run.assert_awaited_once()
+        prompt = router.router_model.run.await_args.args[0]
+        assert all(f"### Task {n}:\n{task}" in prompt for n, task in enumerate(tasks, 1))
+        assert router._inflight == {} and router._queue == []
+
+    @pytest.mark.asyncio
+    async def test_unlabelled_tasks_are_re_asked_individually(self):
+        r"""Should not guess decisions the batched reply leaves out."""
+        router = build_router()
+        router.router_model.run = AsyncMock(
+            side_effect=[ModelResponse(text="Task 2: SMART"), ModelResponse(text="FAST")]
+        )
+
+        results = await asyncio.gather(router.run("Handle the quarterly report"), router.run("Handle the board memo"))
+
+        assert results == ["fast", "smart"]
+        assert router.router_model.run.await_count == 2
+        assert router.router_model.run.await_args.args[0].endswith("Response: [FAST/SMART]")
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_smart_without_caching(self):
+        r"""Should route every task in a failed batch to SMART and ask again next time."""
+        router = build_router()
+        router.router_model.run = AsyncMock(side_effect=RuntimeError("down"))
+
+        results = await asyncio.gather(router.run("Handle the quarterly report"), router.run("Handle the board memo"))
+
+        assert results == ["smart", "smart"]
+        assert router._decision_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_size_one_classifies_each_task_separately(self):
+        r"""Should send one single-task prompt per task when batching is disabled."""
+        router_model = MagicMock()
+        router_model.run = AsyncMock(return_value=ModelResponse(text="SMART"))
+        router = RoutingAgent(router_model=router_model, smart_tier=TierAgent("smart"), router_batch_size=1)
+
+        await asyncio.gather(router.run("Handle the quarterly report"), router.run("Handle the board memo"))
+
+        assert router_model.run.await_count == 2
+
+    def test_rejects_empty_batches(self):
+        r"""A batch must hold at least one task."""
+        with pytest.raises(ValueError, match="router_batch_size"):
+            RoutingAgent(router_model=MagicMock(), router_batch_size=0)
+
+
+class TestRoutingAgentFallback:
+    r"""Tests for routing when the chosen tier is not configured."""
+
+    @pytest.mark.asyncio
+    async def test_missing_route_falls_back_to_first_route(self):
+        r"""Should dispatch to the first configured route when the decided tier is absent."""
+        router_model = MagicMock()
+        router_model.run = AsyncMock(return_value=ModelResponse(text="FAST"))
+        router = RoutingAgent(router_model=router_model, routes={"deep": TierAgent("deep"), "wide": TierAgent("wide")})
+
+        assert await router.run("Handle the quarterly report") == "deep"
+
+    @pytest.mark.asyncio
+    async def test_no_routes_raises(self):
+        r"""Should raise ValueError when no routes are configured at all."""
+        router = RoutingAgent(router_model=MagicMock(run=AsyncMock(return_value=ModelResponse(text="FAST"))))
+
+        with pytest.raises(ValueError, match="no defined routes"):
+            await router.run("Handle the quarterly report")
+
+
+class TestRoutingAgentDispatch:
+    r"""Tests for dispatching to non-Agent targets."""
+
+    @pytest.mark.asyncio
+    async def test_provider_targets_receive_stringified_input(self):
+        r"""Should pass str(input_data) to targets that look like inference providers."""
+        provider = MagicMock(spec=["run", "generate_content_async"])
+        provider.run = AsyncMock(return_value="provider-result")
+        router = RoutingAgent(router_model=MagicMock(), routes={"fast": provider})
+
+        assert await router.run({"q": "What is the capital of Chile?"}) == "provider-result"
+        provider.run.assert_awaited_once_with("{'q': 'What is the capital of Chile?'}")
+
+    @pytest.mark.asyncio
+    async def test_non_runnable_targets_raise_type_error(self):
+        r"""Should raise TypeError for targets without a callable run()."""
+        router = RoutingAgent(router_model=MagicMock(), routes={"fast": object()})
+
+        with pytest.raises(TypeError, match="not a runnable Agent or Provider"):
+            await router.run("What is the capital of Chile?")
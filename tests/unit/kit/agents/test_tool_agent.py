@@ -0,0 +1,101 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Unit tests for forecast.kit.agents.tool."""
+
+from unittest import mock
+
+import pytest
+
+from xrtm.forecast.kit.agents.tool import ToolAgent
+
+
+def double(x):
+    return x * 2
+
+
+def add(a, b):
+    return a + b
+
+
+async def async_double(x):
+    return x * 2
+
+
+async def async_add(a, b):
+    return a + b
+
+
+class TestToolAgent:
+    r"""Tests for ToolAgent dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_sync_function_positional_and_kwargs(self):
+        r"""Should pass scalars positionally and unpack dicts as kwargs."""
+        assert await ToolAgent(double).run(3) == 6
+        assert await ToolAgent(add).run({"a": 1, "b": 2}) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_function_positional_and_kwargs(self):
+        r"""Should await coroutine functions for both input shapes."""
+        assert await ToolAgent(async_double).run(3) == 6
+        assert await ToolAgent(async_add).run({"a": 1, "b": 2}) == 3
+
+    def test_name_defaults_to_function_name(self):
+        r"""Should default the agent name to the wrapped function's name."""
+        assert ToolAgent(async_add).name == "async_add"
+
+    @pytest.mark.asyncio
+    async def test_positional_mode_passes_dicts_unchanged(self):
+        r"""Should pass dict inputs as a single argument in positional mode."""
+        assert await ToolAgent(len, name="len", mode="positional").run({"a": 1, "b": 2}) == 2
+        assert await ToolAgent(async_double, mode="positional").run([1]) == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_kwargs_mode_unpacks_inputs(self):
+        r"""Should always unpack the input as keyword arguments in kwargs mode."""
+        assert await ToolAgent(add, mode="kwargs").run({"a": 2, "b": 5}) == 7
+        assert await ToolAgent(async_add, mode="kwargs").run({"a": 2, "b": 5}) == 7
+
+    def test_unknown_mode_is_rejected(self):
+        r"""Should raise ValueError for unsupported modes."""
+        with pytest.raises(ValueError, match="Unknown ToolAgent mode"):
+            ToolAgent(add, mode="splat")
+
+    @pytest.mark.asyncio
+    async def test_reassigning_fn_updates_dispatch(self):
+        r"""Should dispatch to the new function, sync or async, after `fn` is reassigned."""
+        agent = ToolAgent(double, name="tool")
+
+        agent.fn = async_add
+        assert agent.fn is async_add
+        assert await agent.run({"a": 1, "b": 2}) == 3
+
+        agent.fn = double
+        assert await agent.run(4) == 8
+        assert agent.name == "tool"
+
+    @pytest.mark.asyncio
+    async def test_patched_fn_is_restored(self):
+        r"""Should let `mock.patch.object` swap `fn` and restore the original dispatch."""
+        agent = ToolAgent(double)
+
+        with mock.patch.object(agent, "fn", async_add):
+            assert await agent.run({"a": 1, "b": 2}) == 3
+        assert agent.fn is double
+        assert await agent.run(4) == 8
+
+        del agent.fn
+        assert not hasattr(agent, "fn")
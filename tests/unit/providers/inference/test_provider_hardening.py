@@ -142,3 +142,147 @@ async def test_openai_stream_cancellation_propagates_to_async_iterator():
         await task
 
     assert stream.cancelled is True
+
+
+def test_openai_usage_is_flattened_and_zero_filled():
+    provider = OpenAIProvider(OpenAIConfig(model_id="gpt-test", api_key="fake"))
+    provider.cache = None
+    completions = FakeOpenAICompletions()
+    provider.sync_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))  # type: ignore[assignment]
+
+    response = provider.generate_content("Hello")
+    assert response.usage == {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+
+    def create_without_usage(**_: Any) -> Any:
+        message = SimpleNamespace(content="no usage", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    completions.create = create_without_usage  # type: ignore[method-assign]
+    first = provider.generate_content("Hello")
+    second = provider.generate_content("Hello")
+    assert first.usage == {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    first.usage["total_tokens"] = 99
+    assert second.usage["total_tokens"] == 0
+
+
+@pytest.mark.asyncio
+async def test_openai_logprobs_are_normalized_per_token():
+    provider = OpenAIProvider(OpenAIConfig(model_id="gpt-test", api_key="fake"))
+    tokens = [SimpleNamespace(token="Yes", logprob=-0.1), SimpleNamespace(token=".", logprob=-2.5)]
+
+    class FakeAsyncCompletions:
+        def __init__(self, content: Any) -> None:
+            self.content = content
+
+        async def create(self, **kwargs: Any) -> Any:
+            assert kwargs["logprobs"] is True
+            message = SimpleNamespace(content="Yes.", tool_calls=None)
+            logprobs = SimpleNamespace(content=self.content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message, logprobs=logprobs)], usage=None)
+
+    provider.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeAsyncCompletions(tokens)))  # type: ignore[assignment]
+    response = await provider.generate_content_async("prompt", output_logprobs=True)
+    assert response.logprobs == [{"token": "Yes", "logprob": -0.1}, {"token": ".", "logprob": -2.5}]
+
+    provider.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeAsyncCompletions([])))  # type: ignore[assignment]
+    response = await provider.generate_content_async("prompt", output_logprobs=True)
+    assert response.logprobs is None
+
+
+class FlakyAsyncCompletions:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.call_count = 0
+
+    async def create(self, **_: Any) -> Any:
+        self.call_count += 1
+        if self.call_count <= self.failures:
+            raise TimeoutError(f"attempt {self.call_count} timed out")
+        message = SimpleNamespace(content="recovered", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, logprobs=None)], usage=None)
+
+
+@pytest.mark.asyncio
+async def test_openai_retries_use_decorrelated_jitter(monkeypatch):
+    waits: list = []
+
+    async def record_sleep(seconds: float) -> None:
+        waits.append(seconds)
+
+    monkeypatch.setattr("xrtm.forecast.providers.inference.openai_provider.asyncio.sleep", record_sleep)
+    provider = OpenAIProvider(OpenAIConfig(model_id="gpt-test", api_key="fake"))
+    provider.cache = None
+
+    completions = FlakyAsyncCompletions(failures=2)
+    provider.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))  # type: ignore[assignment]
+    response = await provider.generate_content_async("prompt")
+    assert response.text == "recovered"
+    assert completions.call_count == 3
+    assert len(waits) == 2
+    assert 1.0 <= waits[0] <= 3.0
+    assert 1.0 <= waits[1] <= min(8.0, waits[0] * 3)
+
+    waits.clear()
+    completions = FlakyAsyncCompletions(failures=3)
+    provider.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))  # type: ignore[assignment]
+    with pytest.raises(TimeoutError, match="attempt 3"):
+        await provider.generate_content_async("prompt")
+    assert completions.call_count == 3
+    assert len(waits) == 2
+
+
+@pytest.mark.asyncio
+async def test_openai_retry_waits_are_capped(monkeypatch, caplog):
+    waits: list = []
+
+    async def record_sleep(seconds: float) -> None:
+        waits.append(seconds)
+
+    monkeypatch.setattr("xrtm.forecast.providers.inference.openai_provider.asyncio.sleep", record_sleep)
+    monkeypatch.setattr("xrtm.forecast.providers.inference.openai_provider.random.uniform", lambda low, high: high)
+    provider = OpenAIProvider(OpenAIConfig(model_id="gpt-test", api_key="fake"))
+    provider.cache = None
+    completions = FlakyAsyncCompletions(failures=2)
+    provider.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))  # type: ignore[assignment]
+
+    with caplog.at_level("WARNING", logger="xrtm.forecast.providers.inference.openai_provider"):
+        await provider.generate_content_async("prompt")
+
+    assert waits == [3.0, 8.0]
+    assert "retry 1/2 in 3.00s: attempt 1 timed out" in caplog.text
+    assert "retry 2/2 in 8.00s: attempt 2 timed out" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_openai_tool_calls_resolve_tools_by_name():
+    provider = OpenAIProvider(OpenAIConfig(model_id="gpt-test", api_key="fake"))
+
+    class NamedTool:
+        name = "lookup"
+
+        async def run(self, **kwargs: Any) -> str:
+            return f"named:{kwargs['query']}"
+
+    class ShadowedTool:
+        name = "lookup"
+
+        async def run(self, **kwargs: Any) -> str:
+            return "shadowed"
+
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    def call(call_id: str, name: str, arguments: str) -> SimpleNamespace:
+        return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=arguments))
+
+    results = await provider._execute_tool_calls(
+        [
+            call("1", "lookup", '{"query": "x"}'),
+            call("2", "add", '{"a": 1, "b": 2}'),
+            call("3", "missing", "{}"),
+        ],
+        [NamedTool(), ShadowedTool(), add],
+    )
+
+    assert [r["content"] for r in results] == ["named:x", "3", "Error: Tool missing not found."]
+    assert [r["tool_call_id"] for r in results] == ["1", "2", "3"]
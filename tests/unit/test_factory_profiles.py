@@ -47,3 +47,29 @@ def test_model_factory_preserves_provider_runtime_kwargs(tmp_path):
     assert isinstance(provider, OpenAIProvider)
     assert provider.cache is cache
     cache.close()
+
+
+def test_openai_config_from_trusted_applies_defaults():
+    r"""Trusted construction skips validation but still fills declared defaults."""
+    config = OpenAIConfig.from_trusted(model_id="gpt-4o-mini", api_key=SecretStr("mock-key"))
+
+    assert isinstance(config, OpenAIConfig)
+    assert config.model_id == "gpt-4o-mini"
+    assert config.base_url == "https://api.openai.com/v1"
+    assert config.extra == {}
+
+    provider = ModelFactory.get_provider(config)
+    assert provider.config.model_id == "gpt-4o-mini"
+
+
+def test_model_factory_wraps_plain_api_key_override_once():
+    r"""Plain-string keys applied to an existing config are wrapped; SecretStr keys are reused."""
+    base = OpenAIConfig(model_id="gpt-4o-mini")
+
+    provider = ModelFactory.get_provider(base, api_key="plain-key")
+    assert isinstance(provider.config.api_key, SecretStr)
+    assert provider.api_key == "plain-key"
+
+    secret = SecretStr("secret-key")
+    provider = ModelFactory.get_provider(base, api_key=secret)
+    assert provider.config.api_key is secret
@@ -16,6 +16,7 @@
 from typing import Any, Callable, Dict, Optional
 
 import pytest
+from pydantic import BaseModel
 
 from xrtm.forecast.core.config.graph import GraphConfig
 from xrtm.forecast.core.orchestrator import Orchestrator
@@ -89,3 +90,33 @@ async def test_agent_parsing_logic():
     parsed = agent.parse_output(raw_text)
     assert parsed["value"] == 42
     assert parsed["status"] == "active"
+
+
+def test_agent_parsing_filters_unknown_schema_fields():
+    r"""Verifies that keys outside the schema are dropped before validation."""
+
+    class Verdict(BaseModel):
+        value: int
+        status: str = "unknown"
+
+    agent = MockAgent(model=MockProvider())
+    parsed = agent.parse_output('{"value": 7, "status": "ok", "extra": [1, 2]}', schema=Verdict)
+
+    assert isinstance(parsed, Verdict)
+    assert parsed.value == 7
+    assert parsed.status == "ok"
+
+
+def test_agent_parsing_can_skip_schema_validation():
+    r"""Verifies that validate=False constructs the schema without coercion."""
+
+    class Verdict(BaseModel):
+        value: int
+        status: str = "unknown"
+
+    agent = MockAgent(model=MockProvider())
+    parsed = agent.parse_output('{"value": "7"}', schema=Verdict, validate=False)
+
+    assert isinstance(parsed, Verdict)
+    assert parsed.value == "7"
+    assert parsed.status == "unknown"
@@ -19,6 +19,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from xrtm.forecast.core.schemas.graph import BaseGraphState, TemporalContext
+from xrtm.forecast.core.stages import guardian as guardian_module
 from xrtm.forecast.core.stages.guardian import LeakageGuardian
 from xrtm.forecast.providers.inference.base import ModelResponse
 
@@ -70,3 +71,21 @@ async def test_guardian_redaction_flow():
 
     assert state.node_reports["leak"] == "[REDACTED]"
     provider.generate_content_async.assert_called_once()
+
+
+def test_guardian_regex_prefilter_stops_at_first_future_year():
+    guardian = LeakageGuardian(MockProvider())
+
+    # Past years after the first future one must not change the verdict.
+    assert guardian._regex_pre_filter("2026 then 2001 and 2010", 2024) is True
+    # Digits embedded in longer numbers are not years.
+    assert guardian._regex_pre_filter("id 120305 and 20251", 2024) is False
+    assert guardian._regex_pre_filter("", 2024) is False
+
+
+def test_guardian_regex_prefilter_skips_texts_without_year_prefix(monkeypatch):
+    guardian = LeakageGuardian(MockProvider())
+    monkeypatch.setattr(guardian_module, "_YEAR_PATTERN", None)
+
+    # The substring check answers before the pattern is touched.
+    assert guardian._regex_pre_filter("Revenue grew 15% across 3 regions.", 2024) is False
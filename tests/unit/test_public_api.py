@@ -39,3 +39,102 @@ def test_kit_root_prefers_namespaces_but_keeps_legacy_aliases() -> None:
 
     assert "agents" in kit.__all__
     assert agents.LLMAgent is LLMAgent
+
+
+def test_dir_lists_deferred_exports() -> None:
+    assert set(forecast.__all__) <= set(dir(forecast))
+    assert {"LLMAgent", "ModelFactory"} <= set(dir(forecast))
+    assert set(kit.__all__) <= set(dir(kit))
+
+
+def test_top_level_defers_assistant_import() -> None:
+    import subprocess
+    import sys
+
+    probe = (
+        "import sys, xrtm.forecast as f; "
+        "assert 'xrtm.forecast.kit.assistants.main' not in sys.modules; "
+        "assert callable(f.create_forecasting_analyst); "
+        "assert 'xrtm.forecast.kit.assistants.main' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", probe], check=True)
+
+
+def test_assistants_defer_agent_and_provider_imports() -> None:
+    import subprocess
+    import sys
+
+    probe = (
+        "import sys, xrtm.forecast.kit.assistants.main; "
+        "assert 'xrtm.forecast.kit.agents.specialists.analyst' not in sys.modules; "
+        "assert 'xrtm.forecast.providers.inference.factory' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", probe], check=True)
+
+
+def test_create_forecasting_analyst_wires_provider(monkeypatch) -> None:
+    from xrtm.forecast.kit.agents.specialists.analyst import ForecastingAnalyst
+    from xrtm.forecast.kit.assistants.main import create_forecasting_analyst
+
+    provider = object()
+    monkeypatch.setattr(ModelFactory, "get_provider", staticmethod(lambda model_id: provider))
+
+    analyst = create_forecasting_analyst("openai:gpt-4o-mini", name="Desk")
+
+    assert isinstance(analyst, ForecastingAnalyst)
+    assert analyst.model is provider
+    assert analyst.name == "Desk"
+
+
+def test_top_level_import_defers_core_runtime() -> None:
+    import subprocess
+    import sys
+
+    probe = (
+        "import sys, xrtm.forecast as f; "
+        "assert 'xrtm.forecast.core.orchestrator' not in sys.modules; "
+        "assert 'pydantic' not in sys.modules; "
+        "assert f.Orchestrator.__name__ == 'Orchestrator'; "
+        "assert 'xrtm.forecast.core.orchestrator' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", probe], check=True)
+
+
+def test_top_level_backtest_resolves_deferred_exports_before_freezing() -> None:
+    import subprocess
+    import sys
+
+    probe = (
+        "import asyncio, sys\n"
+        "from datetime import datetime\n"
+        "from xrtm.forecast import BaseGraphState, Orchestrator, TemporalContext\n"
+        "async def node(state, report_progress):\n"
+        "    return None\n"
+        "orch = Orchestrator()\n"
+        "orch.add_node('only', node)\n"
+        "ctx = TemporalContext(reference_time=datetime(2024, 1, 1), is_backtest=True)\n"
+        "asyncio.run(orch.run(BaseGraphState(subject_id='s', temporal_context=ctx), entry_node='only'))\n"
+        "assert 'xrtm.forecast.kit.agents' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", probe], check=True)
+
+
+def test_kit_namespace_backtest_resolves_deferred_exports_before_freezing() -> None:
+    import subprocess
+    import sys
+
+    probe = (
+        "import asyncio, sys\n"
+        "from datetime import datetime\n"
+        "import xrtm.forecast.kit\n"
+        "from xrtm.forecast.core.orchestrator import Orchestrator\n"
+        "from xrtm.forecast.core.schemas.graph import BaseGraphState, TemporalContext\n"
+        "async def node(state, report_progress):\n"
+        "    return None\n"
+        "orch = Orchestrator()\n"
+        "orch.add_node('only', node)\n"
+        "ctx = TemporalContext(reference_time=datetime(2024, 1, 1), is_backtest=True)\n"
+        "asyncio.run(orch.run(BaseGraphState(subject_id='s', temporal_context=ctx), entry_node='only'))\n"
+        "assert 'xrtm.forecast.kit.topologies' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", probe], check=True)
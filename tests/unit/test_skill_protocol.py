@@ -59,6 +59,20 @@ def test_agent_add_skill():
     assert agent.get_skill("mock_skill") == skill
 
 
+def test_agent_add_skill_preserves_prior_snapshot():
+    r"""
+    Verifies that adding a skill rebinds the skill map instead of mutating it in place.
+    """
+    agent = SimpleAgent(name="TestAgent")
+    snapshot = agent.skills
+
+    agent.add_skill(MockSkill())
+
+    assert snapshot == {}
+    assert agent.skills is not snapshot
+    assert "mock_skill" in agent.skills
+
+
 @pytest.mark.asyncio
 async def test_skill_execution():
     r"""
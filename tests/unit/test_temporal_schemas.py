@@ -28,6 +28,11 @@ def test_temporal_context_validation():
     assert ctx.strict_mode is True
 
 
+def test_temporal_context_today_str_uses_reference_date():
+    ctx = TemporalContext(reference_time=datetime(2024, 6, 5, 23, 59), is_backtest=True)
+    assert ctx.today_str == "2024-06-05"
+
+
 def test_graph_state_temporal_integration():
     ref_time = datetime(2024, 6, 15, 12, 0)
     ctx = TemporalContext(reference_time=ref_time, is_backtest=True)